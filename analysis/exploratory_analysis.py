@@ -1,159 +1,161 @@
+"""
+Exploratory analysis report generator.
+
+- Prints summary statistics of the cleaned dataset
+- Renders the four figure groups concurrently in a process pool on the
+  headless Agg backend
+- Caches every figure by a hash of its input columns, plotting parameters
+  and plotting code; unchanged figures are skipped
+- Reports the render time of every figure
+"""
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import seaborn as sns
-import os
 
-os.makedirs('../analysis/output', exist_ok=True)
-print("✓ Output directory ready\n")
+OUTPUT_DIR = "../analysis/output"
+CACHE_FILE = ".figure_cache.json"
 
-sns.set_style("whitegrid")
-plt.rcParams['figure.dpi'] = 100
-plt.rcParams['font.size'] = 11
+def setup_style():
+    sns.set_style("whitegrid")
+    plt.rcParams['figure.dpi'] = 100
+    plt.rcParams['font.size'] = 11
 
-df = pd.read_csv("../data/cleaned_dataset.csv")
+def print_summary(df):
+    print("\nBasic Information:")
+    print(df.info())
 
-print("Cleaned data loaded:", df.shape)
-print("\nBasic Information:")
-print(df.info())
+    print("\nSummary Statistics (All Columns):")
+    print(df.describe(include="all"))
 
-print("\nSummary Statistics (All Columns):")
-print(df.describe(include="all"))
+    print("\nMissing Values per Column:")
 
-print("\nMissing Values per Column:")
+    print(df.isnull().sum())
 
-print(df.isnull().sum())
+    print("\nTotal Missing Values in Dataset:", df.isnull().sum().sum())
 
-print("\nTotal Missing Values in Dataset:", df.isnull().sum().sum())
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    categorical_cols = df.select_dtypes(exclude=[np.number]).columns
 
-numeric_cols = df.select_dtypes(include=[np.number]).columns
-categorical_cols = df.select_dtypes(exclude=[np.number]).columns
+    print("\nDetailed Categorical Stats:")
+    for col in categorical_cols:
+        print(f" Analyzing category column: {col}")
 
-print("\nDetailed Categorical Stats:")
-for col in categorical_cols:
-    print(f" Analyzing category column: {col}")
+        print("\nCategory Distribution:")
+        print(df[col].value_counts())
 
-    print("\nCategory Distribution:")
-    print(df[col].value_counts())
+        print("\nPercentage Distribution:")
+        print((df[col].value_counts(normalize=True) * 100).round(2))
 
-    print("\nPercentage Distribution:")
-    print((df[col].value_counts(normalize=True) * 100).round(2))
+    if len(numeric_cols) > 1:
+        print("\nCorrelation Matrix:")
+        corr = df[numeric_cols].corr()
+        print(corr.round(3))
 
-if len(numeric_cols) > 1:
-    print("\nCorrelation Matrix:")
-    corr = df[numeric_cols].corr()
-    print(corr.round(3))
+        print("\nTop 10 Strongest Correlations:")
+        corr_pairs = corr.abs().unstack()
+        corr_pairs = corr_pairs[corr_pairs < 1]
+        corr_pairs = corr_pairs.dropna().sort_values(ascending=False)
+        print(corr_pairs.head(10))
+    else:
+        print("\nNot enough numeric columns for correlation.")
 
-    print("\nTop 10 Strongest Correlations:")
+def plot_top_correlations(df, path, dpi):
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    corr = df[numeric_cols].corr()
     corr_pairs = corr.abs().unstack()
     corr_pairs = corr_pairs[corr_pairs < 1]
-    corr_pairs = corr_pairs.dropna().sort_values(ascending=False)
-    print(corr_pairs.head(10))
-else:
-    print("\nNot enough numeric columns for correlation.")
-
-
-print("\n" + "=" * 70)
-print("GRAPH 1: Top 10 Strongest Correlations")
-print("=" * 70)
-
-corr = df[numeric_cols].corr()
-corr_pairs = corr.abs().unstack()
-corr_pairs = corr_pairs[corr_pairs < 1]
-corr_pairs = corr_pairs.dropna().sort_values(ascending=False).head(10)
-
-correlations = []
-labels = []
-for idx, value in corr_pairs.items():
-    actual_corr = corr.loc[idx[0], idx[1]]
-    correlations.append(actual_corr)
-    label1 = idx[0].replace('Social Platform Preference ', '').replace('_', ' ')
-    label2 = idx[1].replace('Social Platform Preference ', '').replace('_', ' ')
-    labels.append(f"{label1}\n& {label2}")
-
-fig, ax = plt.subplots(figsize=(14, 9))
-colors = ['#2ecc71' if x > 0 else '#e74c3c' for x in correlations]
-bars = ax.barh(range(len(correlations)), correlations, color=colors,
-               edgecolor='black', linewidth=1.5, alpha=0.8)
-
-for i, v in enumerate(correlations):
-    ax.text(v + 0.02 if v > 0 else v - 0.02, i, f'{v:.3f}',
-            va='center', fontweight='bold', fontsize=11,
-            ha='left' if v > 0 else 'right')
-
-ax.set_yticks(range(len(labels)))
-ax.set_yticklabels(labels, fontsize=10)
-ax.set_xlabel('Correlation Coefficient', fontsize=13, fontweight='bold')
-ax.set_title('Top 10 Strongest Variable Correlations\n(Positive correlations shown in green)',
-             fontsize=16, fontweight='bold', pad=20)
-ax.axvline(x=0, color='black', linestyle='-', linewidth=1.5)
-ax.set_xlim(-0.1, 1.05)
-ax.grid(True, alpha=0.3, axis='x')
-
-plt.tight_layout()
-plt.savefig('../analysis/output/top_correlations.png', dpi=300, bbox_inches='tight')
-plt.show()
-print("✓ Saved: top_correlations.png")
-print(f"  • Strongest: Productivity measures")
-print(f"  • Critical: Social Media ↔ Distraction Load")
-
-
-print("\n" + "=" * 70)
-print("GRAPH 2: Risk Factor Prevalence (ALARMING STATISTICS)")
-print("=" * 70)
-
-risk_factors = {
-    'Too Many Notifications': 'Too Many Notifications',
-    'Burnout Risk': 'Burnout Risk',
-    'High Stress': 'High Stress',
-    'Low Sleep': 'Low Sleep',
-    'Social Addicted': 'Social Media Addiction'
-}
-
-risk_percentages = []
-risk_labels = []
-risk_counts = []
-
-for col, label in risk_factors.items():
-    if col in df.columns:
-        count = df[col].sum()
-        percentage = (count / len(df)) * 100
-        risk_percentages.append(percentage)
-        risk_labels.append(label)
-        risk_counts.append(count)
-
-fig, ax = plt.subplots(figsize=(12, 8))
-
-colors_gradient = ['#c0392b', '#e74c3c', '#e67e22', '#f39c12', '#3498db']
-bars = ax.barh(range(len(risk_labels)), risk_percentages,
-               color=colors_gradient, edgecolor='black', linewidth=2, alpha=0.85)
-
-for i, (pct, count) in enumerate(zip(risk_percentages, risk_counts)):
-    ax.text(pct + 1.5, i, f'{pct:.1f}%\n({count:,} people)',
-            va='center', fontweight='bold', fontsize=11)
-
-ax.set_yticks(range(len(risk_labels)))
-ax.set_yticklabels(risk_labels, fontsize=12, fontweight='bold')
-ax.set_xlabel('Percentage of Population Affected (%)', fontsize=13, fontweight='bold')
-ax.set_title('Risk Factor Prevalence in Dataset\nCritical Health & Wellbeing Indicators',
-             fontsize=16, fontweight='bold', pad=20, color='#c0392b')
-ax.set_xlim(0, 100)
-ax.grid(True, alpha=0.3, axis='x')
-
-ax.axvline(x=50, color='red', linestyle='--', linewidth=2, alpha=0.5, label='50% threshold')
-ax.legend(fontsize=10)
-
-plt.tight_layout()
-plt.savefig('../analysis/output/risk_prevalence.png', dpi=300, bbox_inches='tight')
-plt.show()
-print("✓ Saved: risk_prevalence.png")
+    corr_pairs = corr_pairs.dropna().sort_values(ascending=False).head(10)
+
+    correlations = []
+    labels = []
+    for idx, value in corr_pairs.items():
+        actual_corr = corr.loc[idx[0], idx[1]]
+        correlations.append(actual_corr)
+        label1 = idx[0].replace('Social Platform Preference ', '').replace('_', ' ')
+        label2 = idx[1].replace('Social Platform Preference ', '').replace('_', ' ')
+        labels.append(f"{label1}\n& {label2}")
+
+    fig, ax = plt.subplots(figsize=(14, 9))
+    colors = ['#2ecc71' if x > 0 else '#e74c3c' for x in correlations]
+    bars = ax.barh(range(len(correlations)), correlations, color=colors,
+                   edgecolor='black', linewidth=1.5, alpha=0.8)
+
+    for i, v in enumerate(correlations):
+        ax.text(v + 0.02 if v > 0 else v - 0.02, i, f'{v:.3f}',
+                va='center', fontweight='bold', fontsize=11,
+                ha='left' if v > 0 else 'right')
+
+    ax.set_yticks(range(len(labels)))
+    ax.set_yticklabels(labels, fontsize=10)
+    ax.set_xlabel('Correlation Coefficient', fontsize=13, fontweight='bold')
+    ax.set_title('Top 10 Strongest Variable Correlations\n(Positive correlations shown in green)',
+                 fontsize=16, fontweight='bold', pad=20)
+    ax.axvline(x=0, color='black', linestyle='-', linewidth=1.5)
+    ax.set_xlim(-0.1, 1.05)
+    ax.grid(True, alpha=0.3, axis='x')
 
+    plt.tight_layout()
+    plt.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+
+def plot_risk_prevalence(df, path, dpi):
+    risk_factors = {
+        'Too Many Notifications': 'Too Many Notifications',
+        'Burnout Risk': 'Burnout Risk',
+        'High Stress': 'High Stress',
+        'Low Sleep': 'Low Sleep',
+        'Social Addicted': 'Social Media Addiction'
+    }
+
+    risk_percentages = []
+    risk_labels = []
+    risk_counts = []
+
+    for col, label in risk_factors.items():
+        if col in df.columns:
+            count = df[col].sum()
+            percentage = (count / len(df)) * 100
+            risk_percentages.append(percentage)
+            risk_labels.append(label)
+            risk_counts.append(count)
+
+    fig, ax = plt.subplots(figsize=(12, 8))
+
+    colors_gradient = ['#c0392b', '#e74c3c', '#e67e22', '#f39c12', '#3498db']
+    bars = ax.barh(range(len(risk_labels)), risk_percentages,
+                   color=colors_gradient, edgecolor='black', linewidth=2, alpha=0.85)
+
+    for i, (pct, count) in enumerate(zip(risk_percentages, risk_counts)):
+        ax.text(pct + 1.5, i, f'{pct:.1f}%\n({count:,} people)',
+                va='center', fontweight='bold', fontsize=11)
+
+    ax.set_yticks(range(len(risk_labels)))
+    ax.set_yticklabels(risk_labels, fontsize=12, fontweight='bold')
+    ax.set_xlabel('Percentage of Population Affected (%)', fontsize=13, fontweight='bold')
+    ax.set_title('Risk Factor Prevalence in Dataset\nCritical Health & Wellbeing Indicators',
+                 fontsize=16, fontweight='bold', pad=20, color='#c0392b')
+    ax.set_xlim(0, 100)
+    ax.grid(True, alpha=0.3, axis='x')
+
+    ax.axvline(x=50, color='red', linestyle='--', linewidth=2, alpha=0.5, label='50% threshold')
+    ax.legend(fontsize=10)
 
-print("\n" + "=" * 70)
-print("GRAPH 3: Stress Impact on Productivity & Job Satisfaction")
-print("=" * 70)
+    plt.tight_layout()
+    plt.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
 
-if all(col in df.columns for col in ['Stress Level', 'Actual Productivity Score', 'Job Satisfaction Score']):
+def plot_stress_impact(df, path, dpi):
     fig, axes = plt.subplots(1, 2, figsize=(16, 7))
 
     scatter1 = axes[0].scatter(df['Stress Level'],
@@ -202,81 +204,165 @@ if all(col in df.columns for col in ['Stress Level', 'Actual Productivity Score'
 
     plt.suptitle('Impact of Stress on Work Performance',
                  fontsize=16, fontweight='bold', y=1.02)
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+
+def plot_demographics(df, path, dpi):
+    fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+
+    if 'Gender' in df.columns:
+        gender_counts = df['Gender'].value_counts()
+        colors_gender = ['#3498db', '#e74c3c', '#95a5a6']
+        explode = (0.05, 0.05, 0.1)
+
+        axes[0, 0].pie(gender_counts.values, labels=gender_counts.index,
+                       autopct='%1.1f%%', colors=colors_gender, explode=explode,
+                       startangle=90, textprops={'fontsize': 12, 'fontweight': 'bold'},
+                       shadow=True)
+        axes[0, 0].set_title('Gender Distribution', fontsize=14, fontweight='bold', pad=15)
+
+    if 'Gender' in df.columns:
+        axes[0, 1].bar(gender_counts.index, gender_counts.values,
+                       color=colors_gender, edgecolor='black', linewidth=2)
+        axes[0, 1].set_ylabel('Count', fontsize=12, fontweight='bold')
+        axes[0, 1].set_title('Gender Count', fontsize=14, fontweight='bold', pad=15)
+        axes[0, 1].grid(True, alpha=0.3, axis='y')
+
+        for i, v in enumerate(gender_counts.values):
+            axes[0, 1].text(i, v + 100, f'{v:,}\n({v / len(df) * 100:.1f}%)',
+                            ha='center', fontweight='bold', fontsize=11)
+
+    if 'Job Type' in df.columns:
+        job_counts = df['Job Type'].value_counts()
+        colors_job = sns.color_palette("husl", len(job_counts))
+
+        axes[1, 0].barh(range(len(job_counts)), job_counts.values,
+                        color=colors_job, edgecolor='black', linewidth=1.5)
+        axes[1, 0].set_yticks(range(len(job_counts)))
+        axes[1, 0].set_yticklabels(job_counts.index, fontsize=11)
+        axes[1, 0].set_xlabel('Count', fontsize=12, fontweight='bold')
+        axes[1, 0].set_title('Job Type Distribution', fontsize=14, fontweight='bold', pad=15)
+        axes[1, 0].grid(True, alpha=0.3, axis='x')
+
+        for i, v in enumerate(job_counts.values):
+            axes[1, 0].text(v + 30, i, f'{v:,} ({v / len(df) * 100:.1f}%)',
+                            va='center', fontweight='bold', fontsize=10)
+
+    if 'Job Optimism' in df.columns:
+        optimism_counts = df['Job Optimism'].value_counts()
+        colors_opt = ['#2ecc71', '#f39c12', '#e74c3c']
+
+        axes[1, 1].bar(range(len(optimism_counts)), optimism_counts.values,
+                       color=colors_opt, edgecolor='black', linewidth=2)
+        axes[1, 1].set_xticks(range(len(optimism_counts)))
+        axes[1, 1].set_xticklabels([x.replace(' Job', '') for x in optimism_counts.index],
+                                   fontsize=11, rotation=15)
+        axes[1, 1].set_ylabel('Count', fontsize=12, fontweight='bold')
+        axes[1, 1].set_title('Job Optimism Distribution', fontsize=14, fontweight='bold', pad=15)
+        axes[1, 1].grid(True, alpha=0.3, axis='y')
+
+        for i, v in enumerate(optimism_counts.values):
+            axes[1, 1].text(i, v + 100, f'{v:,}\n({v / len(df) * 100:.1f}%)',
+                            ha='center', fontweight='bold', fontsize=11)
+
+    plt.suptitle(f'Dataset Demographics Overview\n(Total: {len(df):,} participants)',
+                 fontsize=16, fontweight='bold', y=0.995)
+
     plt.tight_layout()
-    plt.savefig('../analysis/output/stress_impact.png', dpi=300, bbox_inches='tight')
-    plt.show()
-    print("✓ Saved: stress_impact.png")
-
-    corr_stress_prod = df['Stress Level'].corr(df['Actual Productivity Score'])
-    corr_stress_sat = df['Stress Level'].corr(df['Job Satisfaction Score'])
-    print(f"  • Stress-Productivity correlation: {corr_stress_prod:.3f}")
-    print(f"  • Stress-Satisfaction correlation: {corr_stress_sat:.3f}")
-
-
-print("\n" + "=" * 70)
-print("GRAPH 4: Dataset Demographics")
-print("=" * 70)
-
-fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-
-if 'Gender' in df.columns:
-    gender_counts = df['Gender'].value_counts()
-    colors_gender = ['#3498db', '#e74c3c', '#95a5a6']
-    explode = (0.05, 0.05, 0.1)
-
-    axes[0, 0].pie(gender_counts.values, labels=gender_counts.index,
-                   autopct='%1.1f%%', colors=colors_gender, explode=explode,
-                   startangle=90, textprops={'fontsize': 12, 'fontweight': 'bold'},
-                   shadow=True)
-    axes[0, 0].set_title('Gender Distribution', fontsize=14, fontweight='bold', pad=15)
-
-if 'Gender' in df.columns:
-    axes[0, 1].bar(gender_counts.index, gender_counts.values,
-                   color=colors_gender, edgecolor='black', linewidth=2)
-    axes[0, 1].set_ylabel('Count', fontsize=12, fontweight='bold')
-    axes[0, 1].set_title('Gender Count', fontsize=14, fontweight='bold', pad=15)
-    axes[0, 1].grid(True, alpha=0.3, axis='y')
-
-    for i, v in enumerate(gender_counts.values):
-        axes[0, 1].text(i, v + 100, f'{v:,}\n({v / len(df) * 100:.1f}%)',
-                        ha='center', fontweight='bold', fontsize=11)
-
-if 'Job Type' in df.columns:
-    job_counts = df['Job Type'].value_counts()
-    colors_job = sns.color_palette("husl", len(job_counts))
-
-    axes[1, 0].barh(range(len(job_counts)), job_counts.values,
-                    color=colors_job, edgecolor='black', linewidth=1.5)
-    axes[1, 0].set_yticks(range(len(job_counts)))
-    axes[1, 0].set_yticklabels(job_counts.index, fontsize=11)
-    axes[1, 0].set_xlabel('Count', fontsize=12, fontweight='bold')
-    axes[1, 0].set_title('Job Type Distribution', fontsize=14, fontweight='bold', pad=15)
-    axes[1, 0].grid(True, alpha=0.3, axis='x')
-
-    for i, v in enumerate(job_counts.values):
-        axes[1, 0].text(v + 30, i, f'{v:,} ({v / len(df) * 100:.1f}%)',
-                        va='center', fontweight='bold', fontsize=10)
-
-if 'Job Optimism' in df.columns:
-    optimism_counts = df['Job Optimism'].value_counts()
-    colors_opt = ['#2ecc71', '#f39c12', '#e74c3c']
-
-    axes[1, 1].bar(range(len(optimism_counts)), optimism_counts.values,
-                   color=colors_opt, edgecolor='black', linewidth=2)
-    axes[1, 1].set_xticks(range(len(optimism_counts)))
-    axes[1, 1].set_xticklabels([x.replace(' Job', '') for x in optimism_counts.index],
-                               fontsize=11, rotation=15)
-    axes[1, 1].set_ylabel('Count', fontsize=12, fontweight='bold')
-    axes[1, 1].set_title('Job Optimism Distribution', fontsize=14, fontweight='bold', pad=15)
-    axes[1, 1].grid(True, alpha=0.3, axis='y')
-
-    for i, v in enumerate(optimism_counts.values):
-        axes[1, 1].text(i, v + 100, f'{v:,}\n({v / len(df) * 100:.1f}%)',
-                        ha='center', fontweight='bold', fontsize=11)
-
-plt.suptitle(f'Dataset Demographics Overview\n(Total: {len(df):,} participants)',
-             fontsize=16, fontweight='bold', y=0.995)
-plt.tight_layout()
-plt.savefig('../analysis/output/demographics.png', dpi=300, bbox_inches='tight')
-plt.show()
-print("✓ Saved: demographics.png")
\ No newline at end of file
+    plt.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+
+RISK_COLUMNS = ['Too Many Notifications', 'Burnout Risk', 'High Stress', 'Low Sleep', 'Social Addicted']
+STRESS_COLUMNS = ['Stress Level', 'Actual Productivity Score', 'Job Satisfaction Score']
+DEMOGRAPHIC_COLUMNS = ['Gender', 'Job Type', 'Job Optimism']
+
+# name -> (plotting function, input columns of df, columns that must all be present)
+FIGURES = {
+    "top_correlations": (plot_top_correlations, lambda df: list(df.select_dtypes(include=[np.number]).columns), []),
+    "risk_prevalence": (plot_risk_prevalence, lambda df: [c for c in RISK_COLUMNS if c in df.columns], []),
+    "stress_impact": (plot_stress_impact, lambda df: STRESS_COLUMNS, STRESS_COLUMNS),
+    "demographics": (plot_demographics, lambda df: [c for c in DEMOGRAPHIC_COLUMNS if c in df.columns], []),
+}
+
+def figure_key(name, data, params):
+    """Hash of the figure's input columns, plotting parameters and plotting code."""
+    digest = hashlib.sha256()
+    digest.update(name.encode())
+    digest.update(json.dumps(params, sort_keys=True).encode())
+    digest.update(inspect.getsource(FIGURES[name][0]).encode())
+    digest.update(json.dumps([[str(c), str(t)] for c, t in data.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def _render(name, data, path, dpi):
+    setup_style()
+    start = time.perf_counter()
+    FIGURES[name][0](data, path, dpi)
+    return time.perf_counter() - start
+
+def render_report(df, output_dir=OUTPUT_DIR, dpi=300, workers=None, force=False):
+    """Renders every figure whose inputs changed; returns {name: (status, seconds)}."""
+    os.makedirs(output_dir, exist_ok=True)
+    cache_path = os.path.join(output_dir, CACHE_FILE)
+    cache = {}
+    if os.path.exists(cache_path) and not force:
+        with open(cache_path, encoding="utf-8") as f:
+            cache = json.load(f)
+
+    results = {}
+    jobs = {}
+    for name, (_, columns, required) in FIGURES.items():
+        if not all(col in df.columns for col in required):
+            results[name] = ("skipped", 0.0)
+            continue
+        data = df[columns(df)]
+        path = os.path.join(output_dir, f"{name}.png")
+        key = figure_key(name, data, {"dpi": dpi})
+        if cache.get(name) == key and os.path.exists(path):
+            results[name] = ("cached", 0.0)
+            continue
+        jobs[name] = (data, path, key)
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(jobs))) as pool:
+            futures = {name: pool.submit(_render, name, data, path, dpi) for name, (data, path, _) in jobs.items()}
+            for name, future in futures.items():
+                results[name] = ("rendered", future.result())
+                cache[name] = jobs[name][2]
+
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2)
+
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Exploratory analysis report of the cleaned dataset")
+    parser.add_argument("--input", default="../data/cleaned_dataset.csv")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR)
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=None, help="Render processes (default: all CPUs)")
+    parser.add_argument("--force", action="store_true", help="Ignore the figure cache")
+    parser.add_argument("--no-summary", action="store_true", help="Skip the printed summary statistics")
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.input)
+    print("Cleaned data loaded:", df.shape)
+
+    if not args.no_summary:
+        print_summary(df)
+
+    print("\n" + "=" * 70)
+    print("Figures")
+    print("=" * 70)
+    start = time.perf_counter()
+    for name, (status, seconds) in render_report(df, args.output_dir, args.dpi, args.workers, args.force).items():
+        if status == "rendered":
+            print(f"✓ Saved: {name}.png ({seconds:.2f}s)")
+        else:
+            print(f"• {status.capitalize()}: {name}.png")
+    print(f"Report finished in {time.perf_counter() - start:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""
+Social Media vs Productivity - ETL pipeline package.
+
+Stage modules are imported on demand by the command line interface
+(etl.cli), so importing the package itself stays cheap.
+"""
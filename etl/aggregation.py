@@ -1,19 +1,120 @@
+import numpy as np
 import pandas as pd
 
-def add_aggregated(df: pd.DataFrame) -> pd.DataFrame:
+# Grouping keys and their number of uniform bins (None = use the column as is)
+GROUP_KEYS = {
+    "job_type": None,
+    "gender": None,
+    "social_platform_preference": None,
+    "age": 5,
+}
+GROUP_STATS = ["mean", "median", "std", "count"]
+OPTIMISM_LABELS = ["Pessimistic Job", "Neutral Job", "Optimistic Job"]
 
-    job_avg = df.groupby("job_type")["perceived_productivity_score"].mean().reset_index()
-    job_avg.rename(columns={"perceived_productivity_score": "avg_perceived_prod"}, inplace=True)
+# Input columns of the columns added by add_aggregated, used by lineage.py
+AGGREGATION_LINEAGE = {
+    "job_optimism": ["job_type", "perceived_productivity_score"],
+}
 
-    global_avg = df["perceived_productivity_score"].mean()
+def group_codes(df: pd.DataFrame, key: str, bins: int = None) -> tuple:
+    """
+    Returns (codes, n_groups) for a grouping key.
+    - Categorical codes are used directly, numeric keys can be cut into uniform bins
+    - Rows with a missing key get code -1
+    """
+    values = df[key]
+    if bins is not None:
+        values = pd.cut(values.astype("float64"), bins=bins)
+    values = values.astype("category")
+    return values.cat.codes.to_numpy(), len(values.cat.categories)
 
-    q1, q2 = job_avg["avg_perceived_prod"].quantile([0.33, 0.66])
-    job_avg["job_optimism"] = pd.cut(
-        job_avg["avg_perceived_prod"],
-        bins=[-999, q1, q2, 999],
-        labels=["Pessimistic Job", "Neutral Job", "Optimistic Job"]
-    )
+def group_table(df: pd.DataFrame, codes: np.ndarray, n_groups: int, value_cols: list, stats: list) -> pd.DataFrame:
+    """
+    Computes every statistic for every value column in one grouped pass.
+    The table has one row per group plus a trailing all-NaN row, so that
+    indexing it with the codes maps missing keys (-1) to NaN.
+    """
+    values = df[value_cols].astype("float64")
+    table = values.groupby(codes).agg(stats).reindex(range(n_groups))
+    table.loc[n_groups] = np.nan
+    for col in table.columns:
+        if col[1] == "count":
+            table[col] = table[col].fillna(0)
+    return table
 
-    df = df.merge(job_avg[["job_type", "job_optimism"]], on="job_type", how="left")
+def quantile_bin_codes(group_values: np.ndarray, quantiles: list) -> np.ndarray:
+    edges = np.nanquantile(group_values, quantiles)
+    bins = np.concatenate([[-np.inf], edges, [np.inf]])
+    return pd.cut(group_values, bins=bins, labels=False)
+
+def compute_group_features(
+    df: pd.DataFrame,
+    value_cols: list,
+    keys: dict = GROUP_KEYS,
+    stats: list = GROUP_STATS,
+    quantile_bins: list = None,
+) -> dict:
+    """
+    Group feature engine.
+    - One grouped pass per key computes all statistics for all value columns
+    - Results are broadcast back to rows by indexing with the group codes
+    - Optional quantile_bins rank each group mean into ordinal bins
+    Returns {column name: row-aligned array}; keys not present in df are skipped.
+    """
+    features = {}
+    for key, bins in keys.items():
+        if key not in df.columns:
+            continue
+
+        codes, n_groups = group_codes(df, key, bins)
+        table_stats = stats if not quantile_bins or "mean" in stats else [*stats, "mean"]
+        table = group_table(df, codes, n_groups, value_cols, table_stats)
+
+        for value_col, stat in table.columns:
+            if stat in stats:
+                features[f"{key}_{stat}_{value_col}"] = table[(value_col, stat)].to_numpy()[codes]
+
+        if quantile_bins:
+            # Ranks the group means already in the table, no second grouped pass
+            for value_col in value_cols:
+                bin_codes = quantile_bin_codes(table[(value_col, "mean")].to_numpy(), quantile_bins)
+                features[f"{key}_bin_{value_col}"] = bin_codes[codes]
+
+    return features
+
+def job_optimism_codes(df: pd.DataFrame) -> tuple:
+    """Returns (row codes, optimism code per job_type group, with -1 for the missing-key row)."""
+    codes, n_groups = group_codes(df, "job_type")
+    job_avg = group_table(df, codes, n_groups, ["perceived_productivity_score"], ["mean"])
+
+    optimism = quantile_bin_codes(job_avg[("perceived_productivity_score", "mean")].to_numpy(), [0.33, 0.66])
+    return codes, np.nan_to_num(optimism, nan=-1).astype(int)
+
+def job_optimism_map(df: pd.DataFrame) -> dict:
+    """job_type -> optimism label, to reuse one fit of the job averages on other data."""
+    _, optimism = job_optimism_codes(df)
+    job_types = df["job_type"].astype("category").cat.categories
+    return {job: OPTIMISM_LABELS[code] for job, code in zip(job_types, optimism) if code >= 0}
+
+def add_aggregated(
+    df: pd.DataFrame,
+    value_cols: list = None,
+    keys: dict = GROUP_KEYS,
+    stats: list = GROUP_STATS,
+    optimism_map: dict = None,
+) -> pd.DataFrame:
+
+    if optimism_map is None:
+        codes, optimism = job_optimism_codes(df)
+        df["job_optimism"] = pd.Categorical.from_codes(optimism[codes], categories=OPTIMISM_LABELS, ordered=True)
+    else:
+        # Job types missing from the map get NaN
+        labels = df["job_type"].astype("object").map(optimism_map)
+        df["job_optimism"] = pd.Categorical(labels, categories=OPTIMISM_LABELS, ordered=True)
+
+    if value_cols:
+        # Broadcast arrays are assigned as columns, the frame is not rebuilt
+        for name, values in compute_group_features(df, value_cols, keys, stats).items():
+            df[name] = values
 
     return df
@@ -0,0 +1,241 @@
+"""
+Concurrent multi-dataset batch runner.
+
+- Reads a manifest of input files (one per line, optionally "input,output")
+- Runs extract, transform and load for every file in a bounded process pool
+- Workers are warmed once: pandas, sklearn and the stage modules are imported
+  and the shared FittedState is unpickled by the pool initializer
+- With a shared state every file uses the same one-hot levels, age bins and
+  job_optimism mapping, fitted once on a reference file
+- Each file succeeds or fails on its own, with retries, also when a worker
+  process dies; the pipeline output and warnings of every attempt are
+  captured instead of interleaving on stdout
+- Returns per-file results and an aggregate throughput report
+"""
+
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from .fitted_state import FittedState
+
+# Set in every worker by _warm_worker
+_STATE = None
+_STARTED = None
+
+def read_manifest(path: str, output_dir: str) -> list:
+    """
+    Returns (input, output) pairs. Lines are "input" or "input,output";
+    blank lines and lines starting with # are ignored. Relative inputs are
+    resolved against the manifest directory, default outputs go to
+    output_dir as <stem>_processed.csv.
+    """
+    base = os.path.dirname(os.path.abspath(path))
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            input_path, _, output_path = (part.strip() for part in line.partition(","))
+            input_path = os.path.join(base, input_path)
+            if not output_path:
+                stem = os.path.splitext(os.path.basename(input_path))[0]
+                output_path = os.path.join(output_dir, f"{stem}_processed.csv")
+            entries.append((input_path, output_path))
+
+    outputs = [output for _, output in entries]
+    duplicates = sorted({output for output in outputs if outputs.count(output) > 1})
+    if duplicates:
+        raise ValueError(f"Several manifest entries write to the same output, give them explicit outputs: {duplicates}")
+    return entries
+
+def fit_shared_state(path: str, columns: list = None) -> FittedState:
+    """Fits the shared state on a reference file, extracted like every batch file."""
+    from .extract import extract_data
+
+    raw_columns = None
+    if columns:
+        from .lineage import required_columns
+
+        raw_columns = required_columns(columns)
+    return FittedState.fit(extract_data(path, columns=raw_columns))
+
+def _warm_worker(state: FittedState, started) -> None:
+    global _STATE, _STARTED
+    import pandas  # noqa: F401
+    import sklearn.preprocessing  # noqa: F401
+    from . import extract, load, transform  # noqa: F401
+
+    _STATE = state
+    _STARTED = started
+
+def process_file(
+    input_path: str,
+    output_path: str,
+    columns: list = None,
+    retries: int = 1,
+    retry_delay: float = 1.0,
+    log_dir: str = None,
+) -> dict:
+    """Runs one file end to end. Never raises: failures are returned in the result."""
+    from .extract import extract_data
+    from .load import load_data
+    from .transform import transform_data
+
+    raw_columns = None
+    if columns:
+        from .lineage import required_columns
+
+        raw_columns = required_columns(columns)
+
+    result = {"input": input_path, "output": output_path, "status": "failed", "attempts": 0, "pid": os.getpid()}
+    log = io.StringIO()
+    start = time.perf_counter()
+    for attempt in range(1, retries + 2):
+        result["attempts"] = attempt
+        try:
+            with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+                df = extract_data(input_path, columns=raw_columns)
+                rows_in = len(df)
+                df = transform_data(df, columns=columns, state=_STATE)
+                os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+                load_data(df, output_path)
+            result.update(status="ok", rows_in=rows_in, rows_out=len(df), columns_out=df.shape[1], error=None)
+            break
+        except Exception as e:
+            log.write(traceback.format_exc())
+            result["error"] = f"{type(e).__name__}: {e}"
+            if attempt <= retries:
+                time.sleep(retry_delay * 2 ** (attempt - 1))
+
+    result["seconds"] = round(time.perf_counter() - start, 4)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+        stem = os.path.splitext(os.path.basename(output_path))[0]
+        with open(os.path.join(log_dir, f"{stem}.log"), "w", encoding="utf-8") as f:
+            f.write(log.getvalue())
+    if result["status"] != "ok":
+        result["log_tail"] = log.getvalue().splitlines()[-10:]
+    return result
+
+def summarize_results(results: list, wall_seconds: float, workers: int, state: FittedState, fit_seconds: float) -> dict:
+    ok = [r for r in results if r["status"] == "ok"]
+    rows_in = sum(r["rows_in"] for r in ok)
+    busy = sum(r.get("seconds", 0.0) for r in results)
+    return {
+        "files": len(results),
+        "succeeded": len(ok),
+        "failed": len(results) - len(ok),
+        "retried": sum(1 for r in results if r.get("attempts", 1) > 1),
+        "workers": workers,
+        "shared_state": state is not None,
+        "fit_seconds": round(fit_seconds, 4),
+        "wall_seconds": round(wall_seconds, 4),
+        "busy_seconds": round(busy, 4),
+        "parallel_efficiency": round(busy / (wall_seconds * workers), 3) if wall_seconds else None,
+        "files_per_second": round(len(ok) / wall_seconds, 3) if wall_seconds else None,
+        "rows_in": rows_in,
+        "rows_out": sum(r["rows_out"] for r in ok),
+        "rows_per_second": round(rows_in / wall_seconds, 1) if wall_seconds else None,
+    }
+
+def _run_entry(index: int, *args) -> dict:
+    # Reported before any work, so a worker that dies can be traced to its file
+    _STARTED.put(index)
+    return process_file(*args)
+
+def _run_pool(entries: list, indices: list, workers: int, state, task_args: tuple, on_result) -> tuple:
+    """
+    Runs indices in one pool. Returns (crashed, unstarted): when the pool
+    breaks, the files a worker had started but not finished, and the ones
+    no worker had started yet.
+    """
+    started = multiprocessing.SimpleQueue()
+    broken = set()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker, initargs=(state, started)) as pool:
+        futures = {pool.submit(_run_entry, i, *entries[i], *task_args): i for i in indices}
+        for future in as_completed(futures):
+            try:
+                on_result(futures[future], future.result())
+            except BrokenProcessPool:
+                broken.add(futures[future])
+
+    seen = set()
+    while not started.empty():
+        seen.add(started.get())
+    return broken & seen, broken - seen
+
+def run_batch(
+    entries: list,
+    workers: int = None,
+    columns: list = None,
+    state: FittedState = None,
+    retries: int = 1,
+    retry_delay: float = 1.0,
+    log_dir: str = None,
+    fit_seconds: float = 0.0,
+) -> dict:
+    """
+    Processes (input, output) entries concurrently. Returns the report:
+    {"summary": aggregate throughput, "files": per-file results in manifest order}.
+
+    A worker that dies (e.g. out of memory) breaks the pool. Only the file it
+    was running is charged an attempt; every unfinished file is resubmitted to
+    a fresh pool. When several files were running, they are rerun one at a time
+    in a single-worker pool, so that a repeated crash is attributed exactly.
+    """
+    workers = min(workers or os.cpu_count() or 1, max(len(entries), 1))
+    task_args = (columns, retries, retry_delay, log_dir)
+    results = {}
+    crashes = {}
+    queued = list(range(len(entries)))
+    isolated = []
+
+    def on_result(i: int, result: dict) -> None:
+        if crashes.get(i):
+            result["attempts"] += crashes[i]
+            result["crashes"] = crashes[i]
+        results[i] = result
+        print(f"[{len(results)}/{len(entries)}] {result['status']:<6} {entries[i][0]} "
+              f"({result.get('seconds', 0.0):.2f}s, {result['attempts']} attempt(s))"
+              + (f": {result['error']}" if result["status"] != "ok" else ""))
+
+    start = time.perf_counter()
+    while queued or isolated:
+        if queued:
+            indices, pool_workers, queued = queued, workers, []
+        else:
+            indices, pool_workers = [isolated.pop(0)], 1
+
+        crashed, unstarted = _run_pool(entries, indices, pool_workers, state, task_args, on_result)
+        queued.extend(sorted(unstarted))
+        if len(crashed) > 1:
+            # Cannot tell which of them took the worker down: rerun each alone, uncharged
+            isolated.extend(sorted(crashed))
+            continue
+
+        for i in crashed:
+            crashes[i] = crashes.get(i, 0) + 1
+            if crashes[i] <= retries:
+                print(f"Worker died on {entries[i][0]}, retrying alone ({crashes[i]}/{retries})")
+                time.sleep(retry_delay * 2 ** (crashes[i] - 1))
+                isolated.append(i)
+            else:
+                on_result(i, {"input": entries[i][0], "output": entries[i][1], "status": "failed", "attempts": 0,
+                              "error": "BrokenProcessPool: the worker process died while running this file"})
+
+    wall_seconds = time.perf_counter() - start
+    files = [results[i] for i in range(len(entries))]
+    return {"summary": summarize_results(files, wall_seconds, workers, state, fit_seconds), "files": files}
+
+def write_report(report: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, default=str)
+    print(f"Batch report saved to {path}")
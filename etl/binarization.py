@@ -1,7 +1,90 @@
+import numpy as np
 import pandas as pd
-from sklearn.preprocessing import OneHotEncoder
 
-def apply_binarization(df: pd.DataFrame) -> pd.DataFrame:
+# (flag column, source column, operator, threshold)
+BINARY_RULES = [
+    ("high_stress", "stress_level", ">=", 6),
+    ("social_addicted", "daily_social_media_time", ">", 4),
+    ("low_sleep", "sleep_hours", "<", 6),
+    ("too_many_notifications", "number_of_notifications", ">", 50),
+    ("burnout_risk", "days_feeling_burnout_per_month", ">=", 10),
+]
+
+OPERATORS = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+
+def apply_rule_flags(df: pd.DataFrame, rules: list = BINARY_RULES) -> pd.DataFrame:
+    """
+    Evaluates every threshold rule in one vectorized pass.
+    - Source columns are stacked into a single float matrix
+    - Each operator is applied once to all rules that use it
+    - Missing values never raise a flag
+    """
+    rules = [rule for rule in rules if rule[1] in df.columns]
+    if not rules:
+        return df
+
+    unknown = {op for _, _, op, _ in rules} - OPERATORS.keys()
+    if unknown:
+        raise ValueError(f"Unknown rule operators: {sorted(unknown)}")
+
+    values = np.column_stack([
+        df[source].to_numpy(dtype="float64", na_value=np.nan) for _, source, _, _ in rules
+    ])
+    thresholds = np.array([threshold for _, _, _, threshold in rules], dtype="float64")
+    ops = np.array([op for _, _, op, _ in rules])
+
+    flags = np.zeros(values.shape, dtype=bool, order="F")
+    for op in np.unique(ops):
+        selected = ops == op
+        flags[:, selected] = OPERATORS[op](values[:, selected], thresholds[selected])
+
+    flags = flags.astype(np.uint8)
+    for i, (flag_col, _, _, _) in enumerate(rules):
+        df[flag_col] = flags[:, i]
+
+    return df
+
+def one_hot_encode(df: pd.DataFrame, columns: list, sparse: bool = False, categories: dict = None) -> pd.DataFrame:
+    """
+    One-hot encodes nominal columns from their categorical codes.
+    - Produces uint8 columns (or sparse ones with fill value 0) aligned to df.index
+    - Replaces each source column in place, no intermediate frame is built
+    - categories fixes the levels per column (e.g. fitted on another file), so
+      absent levels still get a column and unseen ones encode to all zeros
+    """
+    categories = categories or {}
+    for col in columns:
+        if col in categories:
+            values = pd.Series(pd.Categorical(df.pop(col), categories=categories[col]), index=df.index)
+        else:
+            values = df.pop(col).astype("category").cat.remove_unused_categories()
+        codes = values.cat.codes.to_numpy()
+        levels = values.cat.categories
+
+        encoded = np.zeros((len(codes), len(levels)), dtype=np.uint8, order="F")
+        rows = np.flatnonzero(codes >= 0)
+        encoded[rows, codes[rows]] = 1
+
+        for i, level in enumerate(levels):
+            column = encoded[:, i]
+            df[f"{col}_{level}"] = pd.arrays.SparseArray(column, fill_value=0) if sparse else column
+
+    return df
+
+def apply_binarization(
+    df: pd.DataFrame,
+    rules: list = BINARY_RULES,
+    sparse: bool = False,
+    nominal_cols: list = None,
+    categories: dict = None,
+) -> pd.DataFrame:
 
     binary_cols = ["uses_focus_apps", "has_digital_wellbeing_enabled"]
     for col in binary_cols:
@@ -11,31 +94,13 @@ def apply_binarization(df: pd.DataFrame) -> pd.DataFrame:
     if "gender" in df.columns:
         df["gender"] = df["gender"].map({"Male": "M", "Female": "F", "Other": "O"})
 
-    nominal_cols = ["social_platform_preference"]
+    if nominal_cols is None:
+        nominal_cols = ["social_platform_preference"]
     nominal_cols = [col for col in nominal_cols if col in df.columns]
 
     if len(nominal_cols) > 0:
-        encoder = OneHotEncoder(sparse_output=False, handle_unknown="ignore")
-        encoded_data = encoder.fit_transform(df[nominal_cols])
-        encoded_df = pd.DataFrame(
-            encoded_data,
-            columns=encoder.get_feature_names_out(nominal_cols)
-        )
-        df = pd.concat([df.drop(columns=nominal_cols), encoded_df], axis=1)
-
-    if "stress_level" in df.columns:
-        df["high_stress"] = (df["stress_level"] >= 6).astype(int)
-
-    if "daily_social_media_time" in df.columns:
-        df["social_addicted"] = (df["daily_social_media_time"] > 4).astype(int)
-
-    if "sleep_hours" in df.columns:
-        df["low_sleep"] = (df["sleep_hours"] < 6).astype(int)
-
-    if "number_of_notifications" in df.columns:
-        df["too_many_notifications"] = (df["number_of_notifications"] > 50).astype(int)
+        df = one_hot_encode(df, nominal_cols, sparse=sparse, categories=categories)
 
-    if "days_feeling_burnout_per_month" in df.columns:
-        df["burnout_risk"] = (df["days_feeling_burnout_per_month"] >= 10).astype(int)
+    df = apply_rule_flags(df, rules)
 
     return df
@@ -0,0 +1,127 @@
+"""
+Bootstrap replicate engine built on the sampling methods of data_sampling.py.
+
+- Replicates are arrays of row positions, the frame itself is never copied
+- 'random' or 'stratified' (by job_type when available), like perform_sampling
+- Every replicate has its own seed spawned from random_state, so results are
+  reproducible and any single replicate can be regenerated on its own
+- Statistics are vectorized reductions over batches of replicates
+  (np.bincount for grouped means). The batch size follows from an element
+  budget, so a batch holds about BATCH_ELEMENTS row positions at any data size
+"""
+
+import numpy as np
+import pandas as pd
+
+# Row positions per batch of replicates (each batch also materializes values and keys of this size)
+BATCH_ELEMENTS = 5_000_000
+
+class ReplicateEngine:
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        method: str = "random",
+        frac: float = 1.0,
+        n_replicates: int = 1000,
+        random_state: int = 42,
+        stratify_col: str = "job_type",
+    ):
+        if method not in ("random", "stratified"):
+            raise ValueError("Sampling methods should be used: 'random' ose 'stratified'.")
+
+        self.df = df
+        self.n_rows = len(df)
+        self.frac = frac
+        self.n_replicates = n_replicates
+        self.seeds = np.random.SeedSequence(random_state).spawn(n_replicates)
+        self.strata = None
+
+        if method == "stratified":
+            if stratify_col in df.columns:
+                groups = df[stratify_col].astype("category")
+                codes = groups.cat.codes.to_numpy()
+                order = np.argsort(codes, kind="stable")
+                # minlength from the categories, codes.max() fails on an empty frame
+                bounds = np.cumsum(np.bincount(codes[codes >= 0], minlength=len(groups.cat.categories)))
+                first = int((codes < 0).sum())
+                self.strata = np.split(order[first:], bounds[:-1])
+            else:
+                print("No columns available for stratified sampling, random sampling used by default.")
+
+    def replicate(self, i: int) -> np.ndarray:
+        """Row positions of replicate i, drawn with replacement."""
+        rng = np.random.default_rng(self.seeds[i])
+        if self.strata is None:
+            return rng.integers(0, self.n_rows, size=round(self.frac * self.n_rows))
+        return np.concatenate([
+            members[rng.integers(0, len(members), size=round(self.frac * len(members)))]
+            for members in self.strata if len(members) > 0
+        ] or [np.empty(0, dtype=np.int64)])
+
+    def replicate_rows(self) -> int:
+        if self.strata is None:
+            return round(self.frac * self.n_rows)
+        return sum(round(self.frac * len(members)) for members in self.strata)
+
+    def batch_size(self, budget: int = BATCH_ELEMENTS) -> int:
+        """Replicates per batch so that a batch holds at most budget row positions (at least one replicate)."""
+        return max(1, budget // max(self.replicate_rows(), 1))
+
+    def batches(self, batch_size: int = None):
+        """Yields (first replicate number, index matrix of shape (batch, rows))."""
+        batch_size = batch_size or self.batch_size()
+        for start in range(0, self.n_replicates, batch_size):
+            stop = min(start + batch_size, self.n_replicates)
+            yield start, np.stack([self.replicate(i) for i in range(start, stop)])
+
+    def _values(self, column: str) -> np.ndarray:
+        return self.df[column].to_numpy(dtype="float64", na_value=np.nan)
+
+    def means(self, column: str, batch_size: int = None) -> np.ndarray:
+        """Mean of column in every replicate, shape (n_replicates,)."""
+        values = self._values(column)
+        result = np.empty(self.n_replicates)
+        for start, idx in self.batches(batch_size):
+            result[start:start + len(idx)] = np.nanmean(values[idx], axis=1)
+        return result
+
+    def group_means(self, column: str, by: str, batch_size: int = None) -> pd.DataFrame:
+        """Grouped mean of column in every replicate, shape (n_replicates, n_groups)."""
+        values = self._values(column)
+        groups = self.df[by].astype("category")
+        codes = groups.cat.codes.to_numpy()
+        n_groups = len(groups.cat.categories)
+
+        valid = (codes >= 0) & ~np.isnan(values)
+        values = np.where(valid, values, 0.0)
+        # Invalid rows go to an extra bin per replicate that is dropped afterwards
+        codes = np.where(valid, codes, n_groups)
+        width = n_groups + 1
+
+        result = np.empty((self.n_replicates, n_groups))
+        for start, idx in self.batches(batch_size):
+            keys = (np.arange(len(idx))[:, None] * width + codes[idx]).ravel()
+            sums = np.bincount(keys, weights=values[idx].ravel(), minlength=len(idx) * width)
+            counts = np.bincount(keys, minlength=len(idx) * width)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                means = sums / counts
+            result[start:start + len(idx)] = means.reshape(len(idx), width)[:, :n_groups]
+
+        return pd.DataFrame(result, columns=groups.cat.categories)
+
+def group_mean_cutoffs(group_means: pd.DataFrame, quantiles: tuple = (0.33, 0.66)) -> pd.DataFrame:
+    """Quantile cutoffs of the group means in every replicate (e.g. the job_optimism bins)."""
+    cutoffs = np.nanquantile(group_means.to_numpy(), quantiles, axis=1).T
+    return pd.DataFrame(cutoffs, columns=[f"q{q:g}" for q in quantiles])
+
+def summarize_replicates(replicates, ci: float = 0.95) -> pd.DataFrame:
+    """Mean, standard error and percentile confidence interval of each replicated statistic."""
+    replicates = pd.DataFrame(replicates)
+    alpha = (1 - ci) / 2
+    return pd.DataFrame({
+        "mean": replicates.mean(),
+        "std_error": replicates.std(ddof=1),
+        "lower": replicates.quantile(alpha),
+        "upper": replicates.quantile(1 - alpha),
+    })
@@ -0,0 +1,383 @@
+"""
+Command line interface for the ETL pipeline.
+
+- extract:        raw CSV -> typed, deduplicated and sampled CSV
+- transform:      extracted CSV -> processed CSV
+- load:           writes a processed CSV to its final destination
+- run:            extract, transform and load in one go (--mode streaming overlaps
+                  reading, row-local transforms and writing)
+- quality-report: logical data quality issues of a CSV
+- drift:          drift scores between two saved runs, from their column sketches
+- quick-look:     headline statistics with confidence intervals on a growing sample
+- batch:          run many input files from a manifest concurrently, optionally
+                  with one shared fitted state
+- startup-check:  fails when cold start exceeds the import-time budget
+
+Only the standard library is imported at module level. pandas, sklearn and
+the stage modules are imported inside the command that needs them, so that
+`--help` and argument errors stay cheap when launched from a scheduler.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+DEFAULT_INPUT = "data/social_media_vs_productivity.csv"
+DEFAULT_EXTRACTED = "data/extracted_dataset.csv"
+DEFAULT_OUTPUT = "data/processed_dataset.csv"
+# Streaming output has a different schema, keep it apart from the batch output read by analysis/
+DEFAULT_STREAMING_OUTPUT = "data/streamed_dataset.csv"
+DEFAULT_DIAGNOSTICS = "data/extract_diagnostics.json"
+
+# Wall time allowed for a cold `python -m etl --help`, in seconds
+STARTUP_BUDGET_SECONDS = 0.5
+
+def _read_typed(path: str, workers: int = 1):
+    from .data_type_definition import define_data_type
+    from .parallel_csv import read_csv_parallel
+
+    return define_data_type(read_csv_parallel(path, workers=workers))
+
+def _columns(args) -> list:
+    if not args.columns:
+        return None
+    return [col.strip() for col in args.columns.split(",") if col.strip()]
+
+def _diagnostics(args):
+    from .diagnostics import Diagnostics
+
+    return Diagnostics(level=args.diagnostics, sample_rows=args.diagnostics_sample)
+
+def _write_diagnostics(diagnostics, args) -> None:
+    if diagnostics.enabled:
+        diagnostics.write_json(args.diagnostics_out)
+
+def _save_sketches(df, args) -> None:
+    if not args.sketch_dir:
+        return
+    from datetime import datetime, timezone
+    from .sketches import SketchStore, build_sketches
+
+    run_id = args.run_id or datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    path = SketchStore(args.sketch_dir).save(run_id, build_sketches(df), meta={"input": args.input, "rows": len(df)})
+    print(f"Column sketches saved to {path}")
+
+def cmd_extract(args) -> None:
+    from .extract import extract_data
+    from .load import load_data
+
+    diagnostics = _diagnostics(args)
+    df = extract_data(args.input, diagnostics, args.workers)
+    _save_sketches(df, args)
+    load_data(df, args.output, args.workers)
+    _write_diagnostics(diagnostics, args)
+
+def cmd_transform(args) -> None:
+    from .transform import transform_data
+    from .load import load_data
+
+    df = _read_typed(args.input, args.workers)
+    load_data(transform_data(df, columns=_columns(args)), args.output, args.workers)
+
+def cmd_load(args) -> None:
+    from .load import load_data
+    from .parallel_csv import read_csv_parallel
+
+    load_data(read_csv_parallel(args.input, workers=args.workers), args.output, args.workers)
+
+def cmd_run_streaming(args) -> None:
+    import json
+    from .streaming import run_streaming
+
+    ignored = [
+        option for option, used in [
+            ("--columns", args.columns is not None),
+            ("--sketch-dir", args.sketch_dir is not None),
+            ("--diagnostics", args.diagnostics != "off"),
+            ("-w/--workers", args.workers != 1),
+        ] if used
+    ]
+    if ignored:
+        hint = " (use --stream-workers for transform threads)" if "-w/--workers" in ignored else ""
+        sys.exit(f"Not supported with --mode streaming: {', '.join(ignored)}{hint}")
+
+    metrics = run_streaming(
+        args.input, args.output,
+        chunksize=args.chunksize, queue_size=args.queue_size, workers=args.stream_workers,
+    ).as_dict()
+    if args.metrics_out:
+        with open(args.metrics_out, "w", encoding="utf-8") as f:
+            json.dump(metrics, f, indent=2)
+        print(f"Streaming metrics saved to {args.metrics_out}")
+    else:
+        print(json.dumps(metrics, indent=2))
+
+def cmd_run(args) -> None:
+    if args.mode == "streaming":
+        args.output = args.output or DEFAULT_STREAMING_OUTPUT
+        cmd_run_streaming(args)
+        return
+    args.output = args.output or DEFAULT_OUTPUT
+
+    from .extract import extract_data
+    from .transform import transform_data
+    from .load import load_data
+
+    columns = _columns(args)
+    raw_columns = None
+    if columns:
+        from .lineage import required_columns
+
+        raw_columns = required_columns(columns)
+        print(f"Keeping {len(raw_columns)} raw columns: {raw_columns}")
+
+    diagnostics = _diagnostics(args)
+    df = extract_data(args.input, diagnostics, args.workers, columns=raw_columns)
+    _save_sketches(df, args)
+    df_transformed = transform_data(df, columns=columns)
+    load_data(df_transformed, args.output, args.workers)
+    _write_diagnostics(diagnostics, args)
+
+def cmd_quality_report(args) -> None:
+    from .diagnostics import Diagnostics
+
+    # The issue table and the JSON report share one cached FrameDiagnostics
+    diagnostics = Diagnostics(level=args.diagnostics)
+    issues = diagnostics.add("input", _read_typed(args.input)).logical_issue_table
+    if args.output:
+        issues.to_csv(args.output, index_label="issue")
+        print(f"Quality report saved to {args.output}")
+    else:
+        print(issues)
+    if args.diagnostics_out:
+        diagnostics.write_json(args.diagnostics_out)
+
+def cmd_drift(args) -> None:
+    import pandas as pd
+    from .sketches import SketchStore, compare_runs
+
+    store = SketchStore(args.sketch_dir)
+    runs = store.runs()
+    run_a = args.run_a or (runs[-2] if len(runs) >= 2 else None)
+    run_b = args.run_b or (runs[-1] if runs else None)
+    if run_a is None or run_b is None:
+        sys.exit(f"Need two runs in {args.sketch_dir}, found {len(runs)}")
+
+    drift = compare_runs(store, run_a, run_b)
+    print(f"Drift {run_a} -> {run_b}:")
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(drift.round(4))
+
+def _precision(values: list) -> dict:
+    """--precision items: a number for every statistic type, TYPE=VALUE overrides one type."""
+    from .quicklook import resolve_precision
+
+    base, overrides = None, {}
+    for value in values or []:
+        name, sep, number = value.rpartition("=")
+        if sep:
+            overrides[name.strip()] = float(number)
+        else:
+            base = float(number)
+    return resolve_precision({**resolve_precision(base), **overrides})
+
+def cmd_quick_look(args) -> None:
+    from .quicklook import quick_look
+
+    stats = quick_look(
+        args.input,
+        precision=_precision(args.precision), start_frac=args.start_frac, growth=args.growth,
+        max_frac=args.max_frac, confidence=args.confidence, replicates=args.replicates, top_k=args.top_k,
+        impute=not args.no_impute,
+    )
+    if args.output:
+        stats.to_csv(args.output, index=False)
+        print(f"Quick look saved to {args.output}")
+
+def cmd_batch(args) -> None:
+    from .batch import fit_shared_state, read_manifest, run_batch, write_report
+    from .fitted_state import FittedState
+
+    entries = read_manifest(args.manifest, args.output_dir)
+    if not entries:
+        sys.exit(f"No input files in {args.manifest}")
+    columns = _columns(args)
+
+    state = None
+    fit_seconds = 0.0
+    if args.state:
+        state = FittedState.load(args.state)
+        print(f"Shared state loaded from {args.state}")
+    elif args.share_state:
+        fit_on = args.fit_on or entries[0][0]
+        start = time.perf_counter()
+        state = fit_shared_state(fit_on, columns)
+        fit_seconds = time.perf_counter() - start
+        print(f"Shared state fitted on {fit_on} in {fit_seconds:.2f}s")
+    if state is not None and args.save_state:
+        state.save(args.save_state)
+        print(f"Shared state saved to {args.save_state}")
+
+    report = run_batch(
+        entries, workers=args.workers or None, columns=columns, state=state,
+        retries=args.retries, retry_delay=args.retry_delay, log_dir=args.log_dir, fit_seconds=fit_seconds,
+    )
+    summary = report["summary"]
+    print(f"Batch done: {summary['succeeded']}/{summary['files']} files in {summary['wall_seconds']:.2f}s "
+          f"({summary['rows_per_second']} rows/s, {summary['workers']} workers)")
+    write_report(report, args.report or os.path.join(args.output_dir, "batch_report.json"))
+    if summary["failed"]:
+        sys.exit(1)
+
+def measure_startup(repeat: int = 3) -> float:
+    """Best-of-N wall time of a cold `python -m etl --help` in a fresh interpreter."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "etl", "--help"],
+            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def heavy_startup_modules() -> list:
+    """Heavy modules that a fresh `import etl.cli` loads; should be empty."""
+    return subprocess.run(
+        [sys.executable, "-c",
+         "import sys, etl.cli; print(' '.join(m for m in ('pandas', 'numpy', 'sklearn') if m in sys.modules))"],
+        check=True, capture_output=True, text=True,
+    ).stdout.split()
+
+def cmd_startup_check(args) -> None:
+    elapsed = measure_startup(args.repeat)
+    heavy = " ".join(heavy_startup_modules())
+
+    print(f"Cold start: {elapsed:.3f}s (budget {args.budget:.3f}s)")
+    if heavy:
+        print(f"Heavy modules imported at startup: {heavy}")
+    if elapsed > args.budget or heavy:
+        sys.exit(1)
+
+def _add_diagnostics_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--diagnostics", default="off", choices=["off", "summary", "detailed", "full"],
+                        help="Extract diagnostics level (default: off)")
+    parser.add_argument("--diagnostics-out", default=DEFAULT_DIAGNOSTICS, help="JSON report path")
+    parser.add_argument("--diagnostics-sample", type=int, default=10_000,
+                        help="Row bound for sampled diagnostics at the 'detailed' level")
+
+def _add_sketch_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--sketch-dir", default=None, help="Save column sketches of the extract to this directory")
+    parser.add_argument("--run-id", default=None, help="Sketch run id (default: UTC timestamp)")
+
+def _add_columns_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--columns", default=None,
+                        help="Comma-separated output columns; only the stages and raw columns they need are run "
+                             "(protected columns are always included)")
+
+def _add_workers_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="Processes for CSV reading and writing (0 = all CPUs)")
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="pvdh-etl", description="Social Media vs Productivity ETL pipeline")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    extract = commands.add_parser("extract", help="Read, type, deduplicate and sample the raw dataset")
+    extract.add_argument("-i", "--input", default=DEFAULT_INPUT)
+    extract.add_argument("-o", "--output", default=DEFAULT_EXTRACTED)
+    _add_diagnostics_arguments(extract)
+    _add_workers_argument(extract)
+    _add_sketch_arguments(extract)
+    extract.set_defaults(func=cmd_extract)
+
+    transform = commands.add_parser("transform", help="Impute, engineer features and reduce an extracted dataset")
+    transform.add_argument("-i", "--input", default=DEFAULT_EXTRACTED)
+    transform.add_argument("-o", "--output", default=DEFAULT_OUTPUT)
+    _add_workers_argument(transform)
+    _add_columns_argument(transform)
+    transform.set_defaults(func=cmd_transform)
+
+    load = commands.add_parser("load", help="Write a processed dataset to its destination")
+    load.add_argument("-i", "--input", required=True)
+    load.add_argument("-o", "--output", default=DEFAULT_OUTPUT)
+    _add_workers_argument(load)
+    load.set_defaults(func=cmd_load)
+
+    run = commands.add_parser("run", help="Run extract, transform and load end to end")
+    run.add_argument("-i", "--input", default=DEFAULT_INPUT)
+    run.add_argument("-o", "--output", default=None,
+                     help=f"Default: {DEFAULT_OUTPUT} ({DEFAULT_STREAMING_OUTPUT} with --mode streaming)")
+    _add_diagnostics_arguments(run)
+    _add_workers_argument(run)
+    _add_columns_argument(run)
+    _add_sketch_arguments(run)
+    run.add_argument("--mode", default="batch", choices=["batch", "streaming"],
+                     help="streaming runs only the row-local stages, overlapping read, transform and write")
+    run.add_argument("--chunksize", type=int, default=50_000, help="Rows per chunk in streaming mode")
+    run.add_argument("--queue-size", type=int, default=4, help="Bounded queue length between streaming stages")
+    run.add_argument("--stream-workers", type=int, default=2, help="Transform threads in streaming mode")
+    run.add_argument("--metrics-out", default=None, help="JSON path for streaming throughput and queue metrics")
+    run.set_defaults(func=cmd_run)
+
+    quality = commands.add_parser("quality-report", help="Report logical data quality issues")
+    quality.add_argument("-i", "--input", default=DEFAULT_INPUT)
+    quality.add_argument("-o", "--output", default=None, help="CSV path (prints to stdout when omitted)")
+    quality.add_argument("--diagnostics", default="summary", choices=["summary", "detailed", "full"],
+                         help="Level of the optional JSON report")
+    quality.add_argument("--diagnostics-out", default=None, help="Also write the diagnostics JSON report")
+    quality.set_defaults(func=cmd_quality_report)
+
+    drift = commands.add_parser("drift", help="Compare the column sketches of two runs")
+    drift.add_argument("run_a", nargs="?", default=None, help="Reference run (default: second latest)")
+    drift.add_argument("run_b", nargs="?", default=None, help="Compared run (default: latest)")
+    drift.add_argument("--sketch-dir", required=True)
+    drift.set_defaults(func=cmd_drift)
+
+    quick = commands.add_parser("quick-look", help="Approximate pipeline output statistics on a growing random sample")
+    quick.add_argument("-i", "--input", default=DEFAULT_INPUT)
+    quick.add_argument("-o", "--output", default=None, help="CSV path for the statistics of every increment")
+    quick.add_argument("--precision", action="append", default=None, metavar="[TYPE=]VALUE",
+                       help="Target interval half-width, for every statistic type or for one TYPE "
+                            "(job_optimism_cutoff, issue_rate, outlier_rate, correlation); repeatable")
+    quick.add_argument("--start-frac", type=float, default=0.01)
+    quick.add_argument("--growth", type=float, default=2.0, help="Sample fraction multiplier per increment")
+    quick.add_argument("--max-frac", type=float, default=1.0)
+    quick.add_argument("--confidence", type=float, default=0.95)
+    quick.add_argument("--replicates", type=int, default=200, help="Bootstrap replicates for the job_optimism cutoffs")
+    quick.add_argument("--top-k", type=int, default=5, help="Number of strongest correlations to report")
+    quick.add_argument("--no-impute", action="store_true",
+                       help="Skip imputation on the samples: faster, but biases the outlier rate")
+    quick.set_defaults(func=cmd_quick_look)
+
+    batch = commands.add_parser("batch", help="Run the pipeline over a manifest of input files concurrently")
+    batch.add_argument("manifest", help="Text file with one input per line, or 'input,output'")
+    batch.add_argument("--output-dir", default="data/batch", help="Directory for outputs without an explicit path")
+    batch.add_argument("-w", "--workers", type=int, default=0, help="Worker processes (0 = all CPUs)")
+    batch.add_argument("--retries", type=int, default=1, help="Retries per failed file")
+    batch.add_argument("--retry-delay", type=float, default=1.0, help="Seconds before the first retry, doubled after each")
+    batch.add_argument("--share-state", action="store_true",
+                       help="Fit one-hot levels, age bins and job averages once and reuse them for every file")
+    batch.add_argument("--fit-on", default=None, help="Reference file for --share-state (default: first manifest entry)")
+    batch.add_argument("--state", default=None, help="Load a saved shared state instead of fitting one")
+    batch.add_argument("--save-state", default=None, help="Save the shared state as JSON")
+    batch.add_argument("--log-dir", default=None, help="Write the pipeline output of every file to <log-dir>/<name>.log")
+    batch.add_argument("--report", default=None, help="JSON report path (default: <output-dir>/batch_report.json)")
+    _add_columns_argument(batch)
+    batch.set_defaults(func=cmd_batch)
+
+    startup = commands.add_parser("startup-check", help="Fail when cold start exceeds the import-time budget")
+    startup.add_argument("--budget", type=float, default=STARTUP_BUDGET_SECONDS)
+    startup.add_argument("--repeat", type=int, default=3)
+    startup.set_defaults(func=cmd_startup_check)
+
+    return parser
+
+def main(argv: list = None) -> None:
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
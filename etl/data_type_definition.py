@@ -22,7 +22,7 @@ TYPE_MAPPING = {
     "job_satisfaction_score": "float64"
 }
 
-def define_data_type(df: pd.DataFrame, type_map: dict = TYPE_MAPPING) -> pd.DataFrame:
+def define_data_type(df: pd.DataFrame, type_map: dict = TYPE_MAPPING, verbose: bool = False) -> pd.DataFrame:
 
     df_new = df.copy()
     
@@ -36,7 +36,8 @@ def define_data_type(df: pd.DataFrame, type_map: dict = TYPE_MAPPING) -> pd.Data
             except Exception as e:
                 print(f"Warning: Cannot convert '{col}' to '{data_type}'. Error: {e}")
 
-    print("\nData Type Definitions:")
-    print(df_new.dtypes.to_string())
+    if verbose:
+        print("\nData Type Definitions:")
+        print(df_new.dtypes.to_string())
 
     return df_new
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""
+Levelled diagnostics for pipeline stages.
+
+- off:      nothing is computed
+- summary:  shape, dtypes, missing values, logical data issues
+- detailed: adds head, descriptive statistics and unique counts on a bounded sample
+- full:     descriptive statistics and unique counts on the full data
+
+Every diagnostic is computed at most once per frame and shared by all
+sections and reports that need it: the FrameDiagnostics of each stage is kept
+on the Diagnostics object, so the JSON report and the quality report read the
+same cached results instead of recomputing them.
+"""
+
+import json
+from functools import cached_property
+
+import pandas as pd
+
+LEVELS = {"off": 0, "summary": 1, "detailed": 2, "full": 3}
+
+def _jsonable(obj):
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return json.loads(obj.to_json(orient="index" if isinstance(obj, pd.Series) else "split", default_handler=str))
+    return obj
+
+class FrameDiagnostics:
+    """Lazily computed, cached diagnostics of one DataFrame."""
+
+    def __init__(self, df: pd.DataFrame, sample_rows: int = 10_000, random_state: int = 42):
+        self.df = df
+        self.sample_rows = sample_rows
+        self.random_state = random_state
+        self._cache = {}
+
+    @cached_property
+    def sample(self) -> pd.DataFrame:
+        if len(self.df) <= self.sample_rows:
+            return self.df
+        return self.df.sample(n=self.sample_rows, random_state=self.random_state)
+
+    @cached_property
+    def shape(self) -> list:
+        return list(self.df.shape)
+
+    @cached_property
+    def dtypes(self) -> dict:
+        return self.df.dtypes.astype(str).to_dict()
+
+    @cached_property
+    def missing(self) -> dict:
+        counts = self.df.isna().sum()
+        percent = counts / max(len(self.df), 1) * 100
+        return {col: {"count": int(counts[col]), "percent": round(float(percent[col]), 4)} for col in counts.index}
+
+    @cached_property
+    def logical_issue_table(self) -> pd.DataFrame:
+        from .data_quality import assess_data_quality
+
+        return assess_data_quality(self.df)["logical_issues"]
+
+    @cached_property
+    def logical_issues(self) -> dict:
+        return {issue: int(count) for issue, count in self.logical_issue_table["Invalid Count"].items()}
+
+    @cached_property
+    def head(self) -> list:
+        return json.loads(self.df.head().to_json(orient="records", default_handler=str))
+
+    def describe(self, full: bool = False) -> dict:
+        if ("describe", full) not in self._cache:
+            frame = self.df if full else self.sample
+            self._cache[("describe", full)] = _jsonable(frame.describe())
+        return self._cache[("describe", full)]
+
+    def nunique(self, full: bool = False) -> dict:
+        if ("nunique", full) not in self._cache:
+            frame = self.df if full else self.sample
+            columns = frame.select_dtypes(include=["object", "category"]).columns
+            self._cache[("nunique", full)] = {col: int(frame[col].nunique()) for col in columns}
+        return self._cache[("nunique", full)]
+
+    def sections(self, level: int) -> dict:
+        result = {}
+        if level >= LEVELS["summary"]:
+            result["shape"] = self.shape
+            result["dtypes"] = self.dtypes
+            result["missing"] = self.missing
+            result["logical_issues"] = self.logical_issues
+        if level >= LEVELS["detailed"]:
+            full = level >= LEVELS["full"]
+            result["head"] = self.head
+            result["describe"] = self.describe(full)
+            result["nunique"] = self.nunique(full)
+            result["diagnostic_sample_rows"] = len(self.df) if full else len(self.sample)
+        return result
+
+class Diagnostics:
+    """
+    Collects diagnostics of several pipeline stages into one report.
+    - add() keeps one FrameDiagnostics per stage; only the sections enabled
+      by the level are evaluated, and each result is cached on it
+    - frame() gives other reports (e.g. quality-report) the same cached results
+    - note() records cheap counters that the pipeline already knows
+    """
+
+    def __init__(self, level: str = "summary", sample_rows: int = 10_000, random_state: int = 42):
+        if level not in LEVELS:
+            raise ValueError(f"Unknown diagnostics level '{level}', expected one of {list(LEVELS)}")
+        self.level = level
+        self.sample_rows = sample_rows
+        self.random_state = random_state
+        self.frames = {}
+        self.notes = {}
+
+    @property
+    def enabled(self) -> bool:
+        return LEVELS[self.level] > LEVELS["off"]
+
+    def add(self, stage: str, df: pd.DataFrame) -> FrameDiagnostics:
+        if not self.enabled:
+            return None
+        frame = FrameDiagnostics(df, self.sample_rows, self.random_state)
+        frame.sections(LEVELS[self.level])
+        self.frames[stage] = frame
+        return frame
+
+    def frame(self, stage: str) -> FrameDiagnostics:
+        return self.frames[stage]
+
+    @property
+    def stages(self) -> dict:
+        return {stage: frame.sections(LEVELS[self.level]) for stage, frame in self.frames.items()}
+
+    def note(self, key: str, value) -> None:
+        if self.enabled:
+            self.notes[key] = value
+
+    def report(self) -> dict:
+        return {"level": self.level, "stages": self.stages, "notes": self.notes}
+
+    def write_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2, default=str)
+        print(f"Diagnostics saved to {path}")
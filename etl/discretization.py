@@ -1,7 +1,21 @@
+import numpy as np
 import pandas as pd
-from sklearn.preprocessing import KBinsDiscretizer
 
-def apply_discretization(df: pd.DataFrame, column: str, n_bins: int = 4, strategy: str = "uniform") -> pd.DataFrame:
+def fit_bin_edges(values: pd.Series, n_bins: int = 4, strategy: str = "uniform") -> list:
+    """Fits KBinsDiscretizer on one column and returns its bin edges, for reuse on other data."""
+    from sklearn.preprocessing import KBinsDiscretizer
+
+    discretizer = KBinsDiscretizer(n_bins=n_bins, encode='ordinal', strategy=strategy)
+    discretizer.fit(values.astype('float64').to_frame())
+    return discretizer.bin_edges_[0].tolist()
+
+def apply_discretization(
+    df: pd.DataFrame,
+    column: str,
+    n_bins: int = 4,
+    strategy: str = "uniform",
+    bin_edges: list = None,
+) -> pd.DataFrame:
     if column not in df.columns:
         print(f"Warning: Column '{column}' not found in DataFrame. Skipping discretization.")
         return df
@@ -12,6 +26,14 @@ def apply_discretization(df: pd.DataFrame, column: str, n_bins: int = 4, strateg
 
     data_for_discretizer = df[[column]].astype('float64')
 
+    if bin_edges is not None:
+        # Same assignment as KBinsDiscretizer.transform: inner edges, values outside fall in the end bins
+        df[column] = np.searchsorted(np.asarray(bin_edges)[1:-1], data_for_discretizer[column].to_numpy(), side="right")
+        print(f"Discretization applied with fitted edges: Column '{column}' was overwritten with {len(bin_edges) - 1} ordinal bins.")
+        return df
+
+    from sklearn.preprocessing import KBinsDiscretizer
+
     try:
         discretizer = KBinsDiscretizer(n_bins=n_bins, encode='ordinal', strategy=strategy)
         
@@ -1,52 +1,45 @@
 """
 Handles data extraction from raw sources.
 
-- Reads the input CSV dataset.
+- Reads the input CSV dataset, optionally with parallel workers.
 - Applies type definitions and removes duplicate rows.
-- Reports basic data quality.
+- Optionally keeps only the given columns, after deduplication and sampling
+  so that both are decided on whole rows, exactly as in a full run.
+- Records data quality diagnostics at the requested level.
 - Returns a pandas DataFrame ready for preprocessing.
 """
 
 import pandas as pd
-from data_quality import assess_data_quality
-from data_type_definition import define_data_type
-from data_sampling import perform_sampling
-from duplicates import remove_duplicates
-
-def extract_data(file_path: str) -> pd.DataFrame:
-    df = pd.read_csv(file_path)
+from .data_type_definition import define_data_type
+from .data_sampling import perform_sampling
+from .diagnostics import Diagnostics
+from .duplicates import remove_duplicates
+from .parallel_csv import read_csv_parallel
+
+def extract_data(
+    file_path: str,
+    diagnostics: Diagnostics = None,
+    workers: int = 1,
+    columns: list = None,
+) -> pd.DataFrame:
+    diagnostics = diagnostics or Diagnostics(level="off")
+
+    df = read_csv_parallel(file_path, workers=workers)
     df = define_data_type(df)
-    quality_report = assess_data_quality(df)
-    print("Data extracted")
-    print(f"Shape: {df.shape}")
-    print("\nFirst 5 rows:")
-    print(df.head())
-
-    print("\n DataFrame Info:")
-    print(df.info())
-
-    print("\nMissing Values per Column:")
-    missing = df.isnull().sum()
-    missing_percent = (missing / len(df)) * 100
-    print(pd.DataFrame({"Missing Count": missing, "Missing %": missing_percent}))
-
-    duplicates = df.duplicated().sum()
-    print(f"\n Duplicate Rows: {duplicates}")
+    diagnostics.add("raw", df)
 
+    rows_before = len(df)
     df = remove_duplicates(df)
-    print(f"\n Removed duplicates")
-
-    print("\nLogical Data Issues:")
-    print(quality_report["logical_issues"])
-
-    print("\n Descriptive Statistics:")
-    print(df.describe())
-
-    print("\n Unique Value Counts:")
-    for col in df.select_dtypes(include=["object"]).columns[:19]:
-        print(f"{col}: {df[col].nunique()} unique values")
+    diagnostics.note("duplicate_rows", rows_before - len(df))
 
     df_sample = perform_sampling(df, method="stratified", frac=0.5)
     df_sample = df_sample.reset_index(drop=True)
+    diagnostics.note("stratified_sample_rows", len(df_sample))
+
+    if columns:
+        df_sample = df_sample[[col for col in df_sample.columns if col in columns]]
+    diagnostics.add("extracted", df_sample)
+
+    print(f"Data extracted: {df_sample.shape}")
 
-    return df_sample
\ No newline at end of file
+    return df_sample
@@ -1,41 +1,59 @@
 import pandas as pd
 import numpy as np
-from sklearn.feature_selection import VarianceThreshold
-import numpy as np
 
 def _safe_div(a: pd.Series, b: pd.Series) -> pd.Series:
     return (
         a.astype(float) / b.replace({0: np.nan})
     ).replace([np.inf, -np.inf], np.nan).fillna(0.0)
 
-def create_features(df: pd.DataFrame) -> pd.DataFrame:
+# Input columns of every engineered feature, used by lineage.py
+FEATURE_LINEAGE = {
+    "stress_sleep_ratio": ["stress_level", "sleep_hours"],
+    "insomnia_pressure": ["stress_level", "sleep_hours"],
+    "mins_per_notification": ["daily_social_media_time", "number_of_notifications"],
+    "distraction_load": ["daily_social_media_time", "number_of_notifications"],
+    "work_to_social_ratio": ["work_hours_per_day", "daily_social_media_time"],
+    "overbooked_hours": ["work_hours_per_day", "daily_social_media_time", "sleep_hours"],
+    "burnout_rate": ["days_feeling_burnout_per_month"],
+}
+
+def create_features(df: pd.DataFrame, features: list = None) -> pd.DataFrame:
+    """Adds the engineered features, or only those listed in features."""
+    def wanted(name: str) -> bool:
+        return features is None or name in features
+
     # stress_sleep_ratio, insomnia_pressure
     if {"stress_level", "sleep_hours"}.issubset(df.columns):
-        df["stress_sleep_ratio"] = _safe_div(df["stress_level"], df["sleep_hours"])
-        # përdor deficitin e gjumit pa krijuar kolonë të veçantë
-        sleep_deficit = (8 - df["sleep_hours"]).clip(lower=0)
-        df["insomnia_pressure"] = df["stress_level"] * sleep_deficit
+        if wanted("stress_sleep_ratio"):
+            df["stress_sleep_ratio"] = _safe_div(df["stress_level"], df["sleep_hours"])
+        if wanted("insomnia_pressure"):
+            # përdor deficitin e gjumit pa krijuar kolonë të veçantë
+            sleep_deficit = (8 - df["sleep_hours"]).clip(lower=0)
+            df["insomnia_pressure"] = df["stress_level"] * sleep_deficit
 
     # mins_per_notification, distraction_load
     if {"daily_social_media_time", "number_of_notifications"}.issubset(df.columns):
-        df["mins_per_notification"] = _safe_div(
-            df["daily_social_media_time"] * 60,
-            df["number_of_notifications"]
-        )
-        df["distraction_load"] = df["daily_social_media_time"] * df["number_of_notifications"]
+        if wanted("mins_per_notification"):
+            df["mins_per_notification"] = _safe_div(
+                df["daily_social_media_time"] * 60,
+                df["number_of_notifications"]
+            )
+        if wanted("distraction_load"):
+            df["distraction_load"] = df["daily_social_media_time"] * df["number_of_notifications"]
 
     # work_to_social_ratio, overbooked_hours
     if {"work_hours_per_day", "daily_social_media_time"}.issubset(df.columns):
-        df["work_to_social_ratio"] = _safe_div(
-            df["work_hours_per_day"], df["daily_social_media_time"]
-        )
-        if "sleep_hours" in df.columns:
+        if wanted("work_to_social_ratio"):
+            df["work_to_social_ratio"] = _safe_div(
+                df["work_hours_per_day"], df["daily_social_media_time"]
+            )
+        if "sleep_hours" in df.columns and wanted("overbooked_hours"):
             df["overbooked_hours"] = (
                 df["work_hours_per_day"] + df["daily_social_media_time"] + df["sleep_hours"] - 24
             )
 
     # burnout_rate
-    if "days_feeling_burnout_per_month" in df.columns:
+    if "days_feeling_burnout_per_month" in df.columns and wanted("burnout_rate"):
         df["burnout_rate"] = _safe_div(
             df["days_feeling_burnout_per_month"], pd.Series(30, index=df.index)
         )
@@ -0,0 +1,55 @@
+"""
+Fitted transform state that can be shared across datasets.
+
+- categories: one-hot levels of every nominal column
+- age_edges: bin edges of the age discretization
+- optimism_map: job_type -> job_optimism label from the job averages
+
+Fitting on one reference dataset and passing the state to transform_data
+gives every file the same encoded columns, bins and optimism labels,
+instead of refitting them on each file.
+"""
+
+import json
+
+import pandas as pd
+
+from .aggregation import job_optimism_map
+from .dependency_map import dependency_map
+from .discretization import fit_bin_edges
+from .missingValues import advanced_imputation
+
+NOMINAL_COLS = ["social_platform_preference"]
+AGE_BINS = 5
+
+class FittedState:
+    def __init__(self, categories: dict = None, age_edges: list = None, optimism_map: dict = None):
+        self.categories = categories or {}
+        self.age_edges = age_edges
+        self.optimism_map = optimism_map
+
+    @classmethod
+    def fit(cls, df: pd.DataFrame, impute: bool = True) -> "FittedState":
+        """Fits on an extracted frame; imputes first, as transform_data does."""
+        if impute:
+            df = advanced_imputation(df.copy(), dependency_map)
+
+        categories = {
+            col: [str(level) for level in df[col].astype("category").cat.remove_unused_categories().cat.categories]
+            for col in NOMINAL_COLS if col in df.columns
+        }
+        age_edges = fit_bin_edges(df["age"], n_bins=AGE_BINS, strategy="uniform") if "age" in df.columns else None
+        optimism_map = job_optimism_map(df) if {"job_type", "perceived_productivity_score"}.issubset(df.columns) else None
+        return cls(categories, age_edges, optimism_map)
+
+    def as_dict(self) -> dict:
+        return {"categories": self.categories, "age_edges": self.age_edges, "optimism_map": self.optimism_map}
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "FittedState":
+        with open(path, encoding="utf-8") as f:
+            return cls(**json.load(f))
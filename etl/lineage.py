@@ -0,0 +1,89 @@
+"""
+Column-level lineage of the transform pipeline.
+
+- STAGE_LINEAGE maps every produced column to the columns it is computed from,
+  per stage (binarization, aggregation, features, discretization)
+- Imputation adds the dependency_map references of every needed column,
+  transitively, because imputed values feed later imputations
+- required_columns turns a requested output set (plus protected_cols) into
+  the raw input columns that have to be read
+"""
+
+from .aggregation import AGGREGATION_LINEAGE
+from .binarization import BINARY_RULES
+from .data_type_definition import TYPE_MAPPING
+from .dependency_map import dependency_map
+from .features import FEATURE_LINEAGE
+from .protected_cols import protected_cols
+
+# One-hot encoded columns are named <source>_<level>
+ONE_HOT_SOURCES = ["social_platform_preference"]
+
+STAGE_LINEAGE = {
+    "binarization": {flag_col: [source] for flag_col, source, _, _ in BINARY_RULES},
+    "aggregation": AGGREGATION_LINEAGE,
+    "features": FEATURE_LINEAGE,
+    "discretization": {"age": ["age"]},
+}
+
+def normalize_name(name: str) -> str:
+    """Matches snake_case and the Title Case names written by titlecase_columns."""
+    return str(name).strip().lower().replace(" ", "_")
+
+def produced_columns() -> dict:
+    lineage = {}
+    for stage in STAGE_LINEAGE.values():
+        for column, inputs in stage.items():
+            lineage.setdefault(column, set()).update(inputs)
+    return lineage
+
+def source_columns(column: str) -> set:
+    """Raw columns a single output column is computed from."""
+    name = normalize_name(column)
+    for source in ONE_HOT_SOURCES:
+        if name == source or name.startswith(f"{source}_"):
+            return {source}
+
+    lineage = produced_columns()
+    if name in lineage:
+        sources = set()
+        for parent in lineage[name]:
+            sources |= {parent} if parent == name else source_columns(parent)
+        return sources
+
+    raw = {normalize_name(col): col for col in TYPE_MAPPING}
+    if name in raw:
+        return {raw[name]}
+    raise ValueError(f"Unknown output column '{column}': not a raw column and not produced by any stage")
+
+def imputation_closure(columns: set) -> set:
+    needed = set(columns)
+    pending = list(columns)
+    while pending:
+        for ref_col in dependency_map.get(pending.pop(), []):
+            if ref_col not in needed:
+                needed.add(ref_col)
+                pending.append(ref_col)
+    return needed
+
+def output_columns(outputs: list, protected: list = protected_cols) -> list:
+    """Requested outputs plus protected columns, normalized and without repeats."""
+    return list(dict.fromkeys(normalize_name(col) for col in [*outputs, *protected]))
+
+def required_columns(outputs: list, protected: list = protected_cols, stratify_col: str = "job_type") -> list:
+    """Raw input columns needed to produce outputs, in TYPE_MAPPING order."""
+    needed = {stratify_col}
+    for column in output_columns(outputs, protected):
+        needed |= source_columns(column)
+    needed = imputation_closure(needed)
+    return [col for col in TYPE_MAPPING if col in needed]
+
+def select_outputs(columns, outputs: list) -> list:
+    """Columns of a transformed frame that belong to the requested outputs."""
+    wanted = set(outputs)
+    selected = []
+    for col in columns:
+        name = normalize_name(col)
+        if name in wanted or any(name.startswith(f"{src}_") and src in wanted for src in ONE_HOT_SOURCES):
+            selected.append(col)
+    return selected
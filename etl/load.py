@@ -3,10 +3,12 @@ Handles the data loading phase.
 
 - Saves the final processed DataFrame to a specified CSV output path.
 - Ensures consistent file formatting and no index column.
+- Formats row blocks in parallel when more than one worker is requested.
 """
 
 import pandas as pd
+from .parallel_csv import write_csv_parallel
 
-def load_data(df: pd.DataFrame, output_path: str):
-    df.to_csv(output_path, index = False)
+def load_data(df: pd.DataFrame, output_path: str, workers: int = 1):
+    write_csv_parallel(df, output_path, workers=workers, index=False)
     print(f"Data saved tp {output_path}")
\ No newline at end of file
@@ -4,17 +4,13 @@ Main entry point for the ETL pipeline.
 - Extracts data from the CSV source.
 - Transforms it through cleaning, feature engineering, and selection steps.
 - Loads the processed dataset to an output file.
-"""
-from extract import extract_data
-from transform import transform_data
-from load import load_data
-
-if __name__ == "__main__":
-    input_file = "../data/social_media_vs_productivity.csv"
-    output_file = "../data/processed_dataset.csv"
 
-    df = extract_data(input_file)
+Run from the repository root with `python -m etl.main` (same options as
+`pvdh-etl run`), or use the installed `pvdh-etl` command for single stages.
+"""
+import sys
 
-    df_transformed = transform_data(df)
+from .cli import main
 
-    load_data(df_transformed, output_file)
+if __name__ == "__main__":
+    main(["run", *sys.argv[1:]])
@@ -0,0 +1,146 @@
+"""
+Multivariate outlier detection.
+
+- mahalanobis: robust Mahalanobis distance. Columns are centred on their
+  median and scaled by their IQR, the covariance is a Ledoit-Wolf shrinkage
+  estimate, refitted once on the rows that passed the first fit. A row is an
+  outlier when its squared distance exceeds the chi-square quantile.
+- isolation_forest: sklearn IsolationForest, flagging the contamination
+  fraction of rows (default 0.025, in line with the 0.975 chi-square quantile).
+
+Fitting uses a bounded random sample (fit_rows). Scoring converts and scores
+the input in batches of batch_rows, across a process pool when workers > 1,
+so the float copies are bounded by the batch size rather than the number of rows.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+METHODS = ["mahalanobis", "isolation_forest"]
+
+_worker_detector = None
+
+def _init_worker(detector) -> None:
+    global _worker_detector
+    _worker_detector = detector
+
+def _score_batch(batch) -> np.ndarray:
+    return _worker_detector._score_array(_worker_detector._as_array(batch, impute=True))
+
+def _rows(X, start: int, stop: int):
+    return X.iloc[start:stop] if isinstance(X, pd.DataFrame) else X[start:stop]
+
+class MultivariateOutlierDetector:
+
+    def __init__(
+        self,
+        method: str = "mahalanobis",
+        quantile: float = 0.975,
+        contamination: float = 0.025,
+        fit_rows: int = 100_000,
+        batch_rows: int = 250_000,
+        workers: int = 1,
+        random_state: int = 42,
+    ):
+        if method not in METHODS:
+            raise ValueError(f"Unknown outlier method '{method}', expected one of {METHODS}")
+        self.method = method
+        self.quantile = quantile
+        self.contamination = contamination
+        self.fit_rows = fit_rows
+        self.batch_rows = batch_rows
+        self.workers = workers
+        self.random_state = random_state
+
+    def _as_array(self, X, impute: bool = False) -> np.ndarray:
+        if isinstance(X, pd.DataFrame):
+            X = X.to_numpy(dtype="float64", na_value=np.nan)
+        X = np.asarray(X, dtype="float64")
+        # Missing coordinates contribute nothing to the distance
+        return np.where(np.isnan(X), self.center_, X) if impute else X
+
+    def _fit_sample(self, X) -> np.ndarray:
+        # Sample rows before converting, so only fit_rows rows are copied
+        if len(X) > self.fit_rows:
+            rng = np.random.default_rng(self.random_state)
+            rows = np.sort(rng.choice(len(X), size=self.fit_rows, replace=False))
+            X = X.iloc[rows] if isinstance(X, pd.DataFrame) else np.asarray(X)[rows]
+        X = self._as_array(X, impute=False)
+        return X[~np.isnan(X).any(axis=1)]
+
+    def fit(self, X) -> "MultivariateOutlierDetector":
+        X = self._fit_sample(X)
+        if len(X) == 0:
+            raise ValueError("No complete rows available to fit the outlier detector")
+
+        self.center_ = np.median(X, axis=0)
+        q1, q3 = np.percentile(X, [25, 75], axis=0)
+        scale = q3 - q1
+        fallback = X.std(axis=0)
+        scale = np.where(scale > 0, scale, np.where(fallback > 0, fallback, 1.0))
+        self.scale_ = scale
+
+        if self.method == "mahalanobis":
+            from scipy.stats import chi2
+
+            self.threshold_ = chi2.ppf(self.quantile, df=X.shape[1])
+            self._fit_covariance(X)
+            inliers = X[self._score_array(X) <= self.threshold_]
+            if len(inliers) > X.shape[1]:
+                self.center_ = np.median(inliers, axis=0)
+                self._fit_covariance(inliers)
+        else:
+            from sklearn.ensemble import IsolationForest
+
+            self.forest_ = IsolationForest(
+                contamination=self.contamination, random_state=self.random_state
+            ).fit(X)
+            self.threshold_ = -self.forest_.offset_
+
+        return self
+
+    def _fit_covariance(self, X: np.ndarray) -> None:
+        from scipy.linalg import pinvh
+        from sklearn.covariance import LedoitWolf
+
+        Z = (X - self.center_) / self.scale_
+        self.covariance_ = LedoitWolf(assume_centered=True).fit(Z).covariance_
+        self.precision_ = pinvh(self.covariance_)
+
+    def _score_array(self, X: np.ndarray) -> np.ndarray:
+        if self.method == "mahalanobis":
+            Z = (X - self.center_) / self.scale_
+            return np.einsum("ij,jk,ik->i", Z, self.precision_, Z)
+        return -self.forest_.score_samples(X)
+
+    def score(self, X) -> np.ndarray:
+        """Outlier score per row (squared distance or negated isolation score), higher = more anomalous."""
+        starts = range(0, len(X), self.batch_rows)
+        if self.workers == 1 or len(X) <= self.batch_rows:
+            return np.concatenate(
+                [self._score_array(self._as_array(_rows(X, s, s + self.batch_rows), impute=True)) for s in starts]
+                or [np.empty(0)]
+            )
+
+        scores = []
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(self,)) as pool:
+            pending = deque()
+            for start in starts:
+                pending.append(pool.submit(_score_batch, _rows(X, start, start + self.batch_rows)))
+                if len(pending) >= 2 * self.workers:
+                    scores.append(pending.popleft().result())
+            while pending:
+                scores.append(pending.popleft().result())
+        return np.concatenate(scores)
+
+    def predict(self, X) -> np.ndarray:
+        return self.score(X) > self.threshold_
+
+def flag_outliers(df: pd.DataFrame, method: str = "mahalanobis", columns: list = None, **kwargs) -> pd.Series:
+    """Fits a detector on the numeric columns of df and returns the is_outlier flag aligned to df.index."""
+    columns = columns or df.select_dtypes(include=[np.number]).columns.tolist()
+    detector = MultivariateOutlierDetector(method=method, **kwargs).fit(df[columns])
+    return pd.Series(detector.predict(df[columns]), index=df.index, name="is_outlier")
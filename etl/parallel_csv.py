@@ -0,0 +1,156 @@
+"""
+Parallel CSV reading and writing.
+
+- read_csv_parallel splits the file into line-aligned byte ranges and parses
+  each range in a process pool. Quoted fields must not contain line breaks.
+  Columns whose inferred dtype differs between ranges in a way concat cannot
+  reconcile (e.g. numbers in one range, text in another) are parsed again from
+  the whole file, so the result equals a single pd.read_csv. Options that
+  depend on the row position (nrows, skiprows, header, ...) use plain pandas.
+- line_offsets and read_csv_rows read arbitrary data rows by byte offset,
+  without parsing the rest of the file (same line break restriction).
+- write_csv_parallel formats row blocks concurrently and writes them in order.
+  The output is byte-identical to a single df.to_csv call with the same options.
+
+Both fall back to plain pandas for a single worker or small inputs.
+"""
+
+import io
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+CHUNK_BYTES = 32 * 1024 * 1024
+BLOCK_ROWS = 100_000
+
+# read_csv options that refer to positions in the whole file, not valid per byte range
+POSITIONAL_READ_KWARGS = {"nrows", "skiprows", "skipfooter", "header", "index_col", "chunksize", "iterator"}
+
+def _resolve_workers(workers: int) -> int:
+    return max(1, workers or os.cpu_count() or 1)
+
+def line_aligned_ranges(path: str, n_parts: int) -> tuple:
+    """Returns (header bytes, [(start, end), ...]) with every range starting at a line start."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        header = f.readline()
+        data_start = f.tell()
+        step = max((size - data_start) // n_parts, 1)
+
+        bounds = [data_start]
+        for i in range(1, n_parts):
+            f.seek(data_start + i * step)
+            f.readline()
+            position = f.tell()
+            if position >= size:
+                break
+            if position > bounds[-1]:
+                bounds.append(position)
+        bounds.append(size)
+
+    return header, [(start, end) for start, end in zip(bounds[:-1], bounds[1:]) if end > start]
+
+def line_offsets(path: str, block_bytes: int = CHUNK_BYTES) -> tuple:
+    """
+    Returns (header bytes, offsets): data row i spans bytes offsets[i]:offsets[i + 1].
+    Only newlines are scanned, nothing is parsed.
+    """
+    starts = []
+    with open(path, "rb") as f:
+        header = f.readline()
+        position = f.tell()
+        starts.append(np.array([position], dtype=np.int64))
+        while True:
+            block = f.read(block_bytes)
+            if not block:
+                break
+            starts.append(np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == ord("\n")) + position + 1)
+            position += len(block)
+
+    offsets = np.concatenate(starts)
+    if offsets[-1] < position:
+        # Last line has no trailing newline
+        offsets = np.append(offsets, position)
+    return header, offsets
+
+def read_csv_rows(path: str, header: bytes, offsets: np.ndarray, rows, **read_kwargs) -> pd.DataFrame:
+    """Parses only the given data rows (positions from line_offsets), in file order."""
+    parts = [header]
+    with open(path, "rb") as f:
+        for row in np.sort(np.asarray(rows)):
+            f.seek(offsets[row])
+            parts.append(f.read(offsets[row + 1] - offsets[row]))
+    return pd.read_csv(io.BytesIO(b"".join(parts)), **read_kwargs)
+
+def _read_range(path: str, header: bytes, start: int, end: int, read_kwargs: dict) -> pd.DataFrame:
+    with open(path, "rb") as f:
+        f.seek(start)
+        chunk = f.read(end - start)
+    return pd.read_csv(io.BytesIO(header + chunk), **read_kwargs)
+
+def _conflicting_columns(frames: list) -> list:
+    """Columns whose dtypes differ between frames, unless all are numeric (concat widens int to float)."""
+    conflicts = []
+    for col in frames[0].columns:
+        dtypes = {frame[col].dtype for frame in frames}
+        numeric = all(pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype) for dtype in dtypes)
+        if len(dtypes) > 1 and not numeric:
+            conflicts.append(col)
+    return conflicts
+
+def read_csv_parallel(path: str, workers: int = None, chunk_bytes: int = CHUNK_BYTES, **read_kwargs) -> pd.DataFrame:
+    workers = _resolve_workers(workers)
+    size = os.path.getsize(path)
+    if workers == 1 or size <= chunk_bytes or POSITIONAL_READ_KWARGS & read_kwargs.keys():
+        return pd.read_csv(path, **read_kwargs)
+
+    n_parts = max(workers, -(-size // chunk_bytes))
+    header, ranges = line_aligned_ranges(path, n_parts)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_read_range, path, header, start, end, read_kwargs) for start, end in ranges]
+        frames = [future.result() for future in futures]
+
+    df = pd.concat(frames, ignore_index=True)
+    conflicts = _conflicting_columns(frames)
+    if conflicts:
+        # Dtype inference must see the whole column, as a single read does
+        whole = pd.read_csv(path, **{**read_kwargs, "usecols": conflicts})
+        for col in conflicts:
+            df[col] = whole[col]
+    return df
+
+def _format_block(block: pd.DataFrame, header, to_csv_kwargs: dict) -> str:
+    return block.to_csv(header=header, **to_csv_kwargs)
+
+def write_csv_parallel(
+    df: pd.DataFrame,
+    path: str,
+    workers: int = None,
+    block_rows: int = BLOCK_ROWS,
+    **to_csv_kwargs,
+) -> None:
+    workers = _resolve_workers(workers)
+    to_csv_kwargs.setdefault("index", False)
+    if workers == 1 or len(df) <= block_rows:
+        df.to_csv(path, **to_csv_kwargs)
+        return
+
+    header = to_csv_kwargs.pop("header", True)
+    encoding = to_csv_kwargs.pop("encoding", "utf-8")
+    starts = range(0, len(df), block_rows)
+
+    # At most two blocks per worker are in flight, so memory stays bounded
+    with ProcessPoolExecutor(max_workers=workers) as pool, \
+            open(path, "w", encoding=encoding, newline="") as f:
+        pending = deque()
+        for i, start in enumerate(starts):
+            block = df.iloc[start:start + block_rows]
+            pending.append(pool.submit(_format_block, block, header if i == 0 else False, to_csv_kwargs))
+            if len(pending) >= 2 * workers:
+                f.write(pending.popleft().result())
+        while pending:
+            f.write(pending.popleft().result())
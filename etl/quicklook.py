@@ -0,0 +1,207 @@
+"""
+Progressive approximate "quick look" at the headline statistics.
+
+- Draws one random permutation of the row positions with perform_sampling.
+  Every increment reads only the rows it adds (by byte offset when given a
+  CSV path, so the first answer does not wait for the whole file) and runs
+  on the growing prefix, reusing the earlier rows
+- Each prefix goes through transform_data, so the statistics are those of the
+  processed dataset: job_optimism cutoffs (bootstrap), the univariate outlier
+  rate of outliers_detection.py (Wilson interval) and the strongest
+  correlations of exploratory_analysis.py (Fisher z interval). Logical issue
+  rates (Wilson interval) are measured on the typed raw rows, as quality-report does
+- Stops as soon as every interval half-width is within the precision of
+  its statistic type (DEFAULT_PRECISION, in that statistic's unit), or when
+  the sample reaches max_frac
+
+Imputation costs rows x missing values, but the sample size needed for a
+given precision does not grow with the dataset, so it stays on by default;
+impute=False trades some bias (mainly in the outlier rate) for speed.
+"""
+
+import contextlib
+import io
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from .bootstrap import ReplicateEngine, group_mean_cutoffs, summarize_replicates
+from .column_names import to_title_with_spaces
+from .data_quality import assess_data_quality
+from .data_sampling import perform_sampling
+from .data_type_definition import define_data_type
+from .parallel_csv import line_offsets, read_csv_rows
+from .transform import transform_data
+
+# Target half-width per statistic type, in the unit of the statistic
+DEFAULT_PRECISION = {
+    "job_optimism_cutoff": 0.1,   # perceived productivity score points
+    "issue_rate": 0.01,           # proportion of rows
+    "outlier_rate": 0.01,         # proportion of rows
+    "correlation": 0.05,          # Pearson r
+}
+
+# Column names after transform_data
+JOB_TYPE = to_title_with_spaces("job_type")
+PERCEIVED_PRODUCTIVITY = to_title_with_spaces("perceived_productivity_score")
+
+def resolve_precision(precision=None) -> dict:
+    """None = defaults, a number applies to every statistic type, a dict overrides single types."""
+    if precision is None:
+        return dict(DEFAULT_PRECISION)
+    if isinstance(precision, dict):
+        unknown = precision.keys() - DEFAULT_PRECISION.keys()
+        if unknown:
+            raise ValueError(f"Unknown statistic types {sorted(unknown)}, expected {sorted(DEFAULT_PRECISION)}")
+        return {**DEFAULT_PRECISION, **precision}
+    return {statistic: float(precision) for statistic in DEFAULT_PRECISION}
+
+def wilson_interval(successes: int, n: int, confidence: float = 0.95) -> tuple:
+    if n == 0:
+        return np.nan, 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / n
+    denominator = 1 + z ** 2 / n
+    center = (p + z ** 2 / (2 * n)) / denominator
+    half = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denominator
+    return p, max(center - half, 0.0), min(center + half, 1.0)
+
+def correlation_interval(r: float, n: int, confidence: float = 0.95) -> tuple:
+    if n <= 3 or not np.isfinite(r):
+        return r, -1.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    fisher = np.arctanh(np.clip(r, -0.999999, 0.999999))
+    half = z / np.sqrt(n - 3)
+    return r, float(np.tanh(fisher - half)), float(np.tanh(fisher + half))
+
+def univariate_outlier_mask(df: pd.DataFrame) -> pd.Series:
+    """Same rule as outliers_detection.py: any column is an IQR or |z|>3 outlier."""
+    numeric = df.select_dtypes(include=[np.number]).astype("float64")
+    q1, q3 = numeric.quantile(0.25), numeric.quantile(0.75)
+    iqr = (q3 - q1).replace(0, np.nan)
+    outliers_iqr = (numeric < q1 - 1.5 * iqr) | (numeric > q3 + 1.5 * iqr)
+    z_scores = ((numeric - numeric.mean()) / numeric.std(ddof=0)).abs()
+    return (outliers_iqr | (z_scores > 3)).any(axis=1)
+
+def top_correlations(df: pd.DataFrame, top_k: int = 5) -> pd.Series:
+    """Strongest pairs as ranked by exploratory_analysis.py (|r| < 1, each pair once)."""
+    corr = df.select_dtypes(include=[np.number]).astype("float64").corr()
+    pairs = corr.where(np.triu(np.ones(corr.shape, dtype=bool), k=1)).stack()
+    pairs = pairs[pairs.abs() < 1]
+    return pairs.reindex(pairs.abs().sort_values(ascending=False).index).head(top_k)
+
+def headline_statistics(
+    raw: pd.DataFrame,
+    processed: pd.DataFrame,
+    confidence: float = 0.95,
+    replicates: int = 200,
+    top_k: int = 5,
+    random_state: int = 42,
+) -> pd.DataFrame:
+    """raw: typed sample rows; processed: the same rows after transform_data."""
+    rows = []
+    n = len(processed)
+
+    if {JOB_TYPE, PERCEIVED_PRODUCTIVITY}.issubset(processed.columns):
+        engine = ReplicateEngine(processed, method="stratified", n_replicates=replicates,
+                                 random_state=random_state, stratify_col=JOB_TYPE)
+        group_means = engine.group_means(PERCEIVED_PRODUCTIVITY, by=JOB_TYPE)
+        observed = group_mean_cutoffs(
+            processed.groupby(JOB_TYPE, observed=False)[PERCEIVED_PRODUCTIVITY].mean().to_frame().T
+        ).iloc[0]
+        summary = summarize_replicates(group_mean_cutoffs(group_means), ci=confidence)
+        for cutoff, row in summary.iterrows():
+            rows.append(("job_optimism_cutoff", cutoff, observed[cutoff], row["lower"], row["upper"]))
+
+    issues = assess_data_quality(raw)["logical_issues"]["Invalid Count"]
+    for issue, count in issues.items():
+        rows.append(("issue_rate", issue, *wilson_interval(int(count), len(raw), confidence)))
+
+    outliers = int(univariate_outlier_mask(processed).sum())
+    rows.append(("outlier_rate", "univariate", *wilson_interval(outliers, n, confidence)))
+
+    for (a, b), r in top_correlations(processed, top_k).items():
+        rows.append(("correlation", f"{a} ~ {b}", *correlation_interval(r, n, confidence)))
+
+    stats = pd.DataFrame(rows, columns=["statistic", "name", "estimate", "lower", "upper"])
+    stats["half_width"] = (stats["upper"] - stats["lower"]) / 2
+    return stats
+
+def _row_reader(source) -> tuple:
+    """(number of rows, read(positions) -> raw rows) for a CSV path or an already typed DataFrame."""
+    if isinstance(source, pd.DataFrame):
+        return len(source), lambda positions: source.iloc[np.sort(positions)]
+    header, offsets = line_offsets(source)
+    return len(offsets) - 1, lambda positions: read_csv_rows(source, header, offsets, positions)
+
+def quick_look(
+    source,
+    precision: dict = None,
+    start_frac: float = 0.01,
+    growth: float = 2.0,
+    max_frac: float = 1.0,
+    confidence: float = 0.95,
+    replicates: int = 200,
+    top_k: int = 5,
+    impute: bool = True,
+    random_state: int = 42,
+    report=print,
+) -> pd.DataFrame:
+    """
+    Returns the statistics of every increment. source is a CSV path (rows are
+    read on demand) or a typed DataFrame. precision is the target interval
+    half-width per statistic type (see resolve_precision).
+    """
+    precision = resolve_precision(precision)
+    n_rows, read_rows = _row_reader(source)
+    with contextlib.redirect_stdout(io.StringIO()):
+        positions = perform_sampling(
+            pd.DataFrame({"row": np.arange(n_rows)}), method="random", frac=1.0, random_state=random_state
+        )["row"].to_numpy()
+
+    parts = []
+    increments = []
+    frac = start_frac
+    step = 0
+    while True:
+        frac = min(frac, max_frac)
+        size = max(int(round(n_rows * frac)), 1)
+        read = sum(len(part) for part in parts)
+        if size > read:
+            parts.append(read_rows(positions[read:size]))
+
+        # Stage output and warnings of every increment would drown the report
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            raw = pd.concat(parts, ignore_index=True)
+            if not isinstance(source, pd.DataFrame):
+                raw = define_data_type(raw)
+            processed = transform_data(raw.copy(), impute=impute)
+
+        stats = headline_statistics(raw, processed, confidence, replicates, top_k, random_state)
+        stats.insert(0, "increment", step)
+        stats.insert(1, "frac", frac)
+        stats.insert(2, "rows", len(raw))
+        stats["target"] = stats["statistic"].map(precision)
+        stats["converged"] = stats["half_width"] <= stats["target"]
+        increments.append(stats)
+
+        open_stats = stats.loc[~stats["converged"], "statistic"].unique().tolist()
+        if report:
+            report(f"\nIncrement {step}: {len(raw)} rows ({frac:.2%}), "
+                   f"{int(stats['converged'].sum())}/{len(stats)} statistics within precision")
+            report(stats[["statistic", "name", "estimate", "lower", "upper", "half_width"]].round(4).to_string(index=False))
+
+        if not open_stats:
+            if report:
+                report(f"Requested precision reached at {frac:.2%} of the data.")
+            break
+        if frac >= max_frac:
+            if report:
+                report(f"Sample reached {max_frac:.0%} of the data before the precision of: {', '.join(open_stats)}.")
+            break
+
+        frac *= growth
+        step += 1
+
+    return pd.concat(increments, ignore_index=True)
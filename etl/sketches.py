@@ -0,0 +1,159 @@
+"""
+Per-run column sketches and drift comparison.
+
+- build_sketches summarises every TYPE_MAPPING column of a frame:
+  missing rate, HyperLogLog distinct count, and either min/max plus a
+  quantile sketch (numeric) or category frequencies (category)
+- SketchStore keeps one small JSON file per pipeline run
+- compare_sketches scores drift between two runs from the sketches alone:
+  KS distance (numeric) or total variation distance (category), and PSI
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from .data_type_definition import TYPE_MAPPING
+
+N_QUANTILES = 101
+HLL_PRECISION = 12
+PSI_ALERT = 0.2
+PSI_EPSILON = 1e-4
+
+def hll_distinct(values: np.ndarray, precision: int = HLL_PRECISION) -> int:
+    """HyperLogLog estimate of the number of distinct values."""
+    m = 1 << precision
+    if len(values) == 0:
+        return 0
+
+    hashes = pd.util.hash_array(values)
+    buckets = (hashes >> np.uint64(64 - precision)).astype(np.intp)
+    rest = hashes & np.uint64((1 << (64 - precision)) - 1)
+    # frexp exponent is the bit length, exact since rest < 2**53
+    bit_length = np.frexp(rest.astype("float64"))[1]
+    ranks = (64 - precision - bit_length + 1).astype(np.uint8)
+
+    registers = np.zeros(m, dtype=np.uint8)
+    np.maximum.at(registers, buckets, ranks)
+
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.ldexp(1.0, -registers.astype(int)))
+    zeros = int((registers == 0).sum())
+    if estimate <= 2.5 * m and zeros > 0:
+        estimate = m * np.log(m / zeros)
+    return int(round(estimate))
+
+def _sketch_column(series: pd.Series, data_type: str, n_quantiles: int) -> dict:
+    missing = series.isna()
+    present = series[~missing]
+    sketch = {
+        "count": int(len(series)),
+        "missing_rate": float(missing.mean()) if len(series) else 0.0,
+    }
+
+    if data_type == "category":
+        values = present.astype(str).to_numpy(dtype=object)
+        sketch["kind"] = "categorical"
+        sketch["distinct"] = hll_distinct(values)
+        sketch["frequencies"] = present.astype(str).value_counts(normalize=True).to_dict()
+    else:
+        values = present.to_numpy(dtype="float64")
+        sketch["kind"] = "numeric"
+        sketch["distinct"] = hll_distinct(values)
+        if len(values):
+            sketch["min"] = float(values.min())
+            sketch["max"] = float(values.max())
+            sketch["quantiles"] = np.quantile(values, np.linspace(0, 1, n_quantiles)).tolist()
+        else:
+            sketch["min"] = sketch["max"] = None
+            sketch["quantiles"] = []
+
+    return sketch
+
+def build_sketches(df: pd.DataFrame, type_map: dict = TYPE_MAPPING, n_quantiles: int = N_QUANTILES) -> dict:
+    return {
+        col: _sketch_column(df[col], data_type, n_quantiles)
+        for col, data_type in type_map.items() if col in df.columns
+    }
+
+class SketchStore:
+    """One JSON file of column sketches per pipeline run."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, run_id: str) -> str:
+        return os.path.join(self.root, f"{run_id}.json")
+
+    def save(self, run_id: str, sketches: dict, meta: dict = None) -> str:
+        os.makedirs(self.root, exist_ok=True)
+        path = self._path(run_id)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"run_id": run_id, "meta": meta or {}, "columns": sketches}, f)
+        return path
+
+    def load(self, run_id: str) -> dict:
+        with open(self._path(run_id), encoding="utf-8") as f:
+            return json.load(f)["columns"]
+
+    def runs(self) -> list:
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name[:-5] for name in os.listdir(self.root) if name.endswith(".json"))
+
+def _step_cdf(quantiles: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """CDF implied by evenly spaced quantiles, evaluated at points."""
+    probs = np.linspace(0, 1, len(quantiles))
+    below = np.searchsorted(quantiles, points, side="right")
+    return np.where(below > 0, probs[np.maximum(below - 1, 0)], 0.0)
+
+def _psi(expected: np.ndarray, actual: np.ndarray) -> float:
+    expected = np.clip(expected, PSI_EPSILON, None)
+    actual = np.clip(actual, PSI_EPSILON, None)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+def _numeric_drift(a: dict, b: dict) -> tuple:
+    qa, qb = np.asarray(a["quantiles"]), np.asarray(b["quantiles"])
+    if len(qa) == 0 or len(qb) == 0:
+        return np.nan, np.nan
+
+    grid = np.union1d(qa, qb)
+    ks = float(np.max(np.abs(_step_cdf(qa, grid) - _step_cdf(qb, grid))))
+
+    edges = np.unique(np.quantile(qa, np.linspace(0.1, 0.9, 9)))
+    bins_a = np.diff(np.concatenate([[0.0], _step_cdf(qa, edges), [1.0]]))
+    bins_b = np.diff(np.concatenate([[0.0], _step_cdf(qb, edges), [1.0]]))
+    return ks, _psi(bins_a, bins_b)
+
+def _categorical_drift(a: dict, b: dict) -> tuple:
+    levels = sorted(set(a["frequencies"]) | set(b["frequencies"]))
+    pa = np.array([a["frequencies"].get(level, 0.0) for level in levels])
+    pb = np.array([b["frequencies"].get(level, 0.0) for level in levels])
+    return float(0.5 * np.abs(pa - pb).sum()), _psi(pa, pb)
+
+def compare_sketches(a: dict, b: dict) -> pd.DataFrame:
+    """Drift of every column present in both runs, with run a as the reference."""
+    rows = {}
+    for col in a:
+        if col not in b or a[col]["kind"] != b[col]["kind"]:
+            continue
+        if a[col]["kind"] == "numeric":
+            distance, psi = _numeric_drift(a[col], b[col])
+        else:
+            distance, psi = _categorical_drift(a[col], b[col])
+        rows[col] = {
+            "kind": a[col]["kind"],
+            "distance": distance,
+            "psi": psi,
+            "drifted": bool(psi > PSI_ALERT),
+            "missing_rate_a": a[col]["missing_rate"],
+            "missing_rate_b": b[col]["missing_rate"],
+            "distinct_a": a[col]["distinct"],
+            "distinct_b": b[col]["distinct"],
+        }
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+def compare_runs(store: SketchStore, run_a: str, run_b: str) -> pd.DataFrame:
+    return compare_sketches(store.load(run_a), store.load(run_b))
@@ -0,0 +1,192 @@
+"""
+Overlapped read / transform / write execution mode.
+
+- A reader thread parses the input CSV in chunks
+- Transform threads apply the row-local stages to each chunk
+- A writer thread appends finished chunks to the output in input order
+- Stages are connected by bounded queues, so a slow stage applies
+  backpressure instead of letting chunks pile up in memory
+- Transform threads do not start a chunk more than queue_size + workers
+  chunks ahead of the writer, which bounds the writer's reorder buffer
+
+Only row-local stages run here: type definitions, binary columns and
+threshold flags, create_features and column renaming. Stages that need the
+whole dataset (deduplication, sampling, imputation, one-hot encoding,
+aggregation, discretization, reduction) are left to the batch pipeline.
+"""
+
+import queue
+import threading
+import time
+
+import pandas as pd
+
+from .binarization import apply_binarization
+from .column_names import titlecase_columns
+from .data_type_definition import define_data_type
+from .features import create_features
+
+_DONE = object()
+
+def transform_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    chunk = define_data_type(chunk)
+    chunk = apply_binarization(chunk, nominal_cols=[])
+    chunk = create_features(chunk)
+    return titlecase_columns(chunk)
+
+class StreamMetrics:
+    """Throughput, per-stage busy time and queue depths of a streaming run."""
+
+    def __init__(self):
+        self.chunks = 0
+        self.rows = 0
+        self.seconds = 0.0
+        self.busy = {"read": 0.0, "transform": 0.0, "write": 0.0}
+        self.depths = {"read_queue": [], "write_queue": [], "reorder_buffer": []}
+        self._lock = threading.Lock()
+
+    def add_busy(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.busy[stage] += seconds
+
+    def as_dict(self) -> dict:
+        return {
+            "chunks": self.chunks,
+            "rows": self.rows,
+            "seconds": round(self.seconds, 4),
+            "rows_per_second": round(self.rows / self.seconds, 1) if self.seconds else None,
+            "busy_seconds": {stage: round(value, 4) for stage, value in self.busy.items()},
+            "queue_depth": {
+                name: {
+                    "max": max(depths, default=0),
+                    "mean": round(sum(depths) / len(depths), 2) if depths else 0.0,
+                }
+                for name, depths in self.depths.items()
+            },
+        }
+
+def run_streaming(
+    input_path: str,
+    output_path: str,
+    chunksize: int = 50_000,
+    queue_size: int = 4,
+    workers: int = 2,
+    transform=transform_chunk,
+) -> StreamMetrics:
+    read_queue = queue.Queue(maxsize=queue_size)
+    write_queue = queue.Queue(maxsize=queue_size)
+    metrics = StreamMetrics()
+    stop = threading.Event()
+    errors = []
+    # Chunks may run at most `window` ahead of the next one to write
+    window = queue_size + workers
+    progress = threading.Condition()
+    written = [0]
+
+    def put(q, item, depth_name=None) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            if depth_name:
+                metrics.depths[depth_name].append(q.qsize())
+            return True
+        return False
+
+    def get(q):
+        while not stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return None
+
+    def guarded(stage):
+        def run():
+            try:
+                stage()
+            except BaseException as e:
+                errors.append(e)
+                stop.set()
+        return run
+
+    def reader():
+        chunks = pd.read_csv(input_path, chunksize=chunksize)
+        seq = 0
+        while True:
+            start = time.perf_counter()
+            chunk = next(chunks, None)
+            metrics.add_busy("read", time.perf_counter() - start)
+            if chunk is None:
+                break
+            if not put(read_queue, (seq, chunk), "read_queue"):
+                return
+            seq += 1
+        for _ in range(workers):
+            put(read_queue, _DONE)
+
+    def transformer():
+        while True:
+            item = get(read_queue)
+            if item is None:
+                return
+            if item is _DONE:
+                put(write_queue, _DONE)
+                return
+            seq, chunk = item
+            with progress:
+                while seq - written[0] >= window and not stop.is_set():
+                    progress.wait(timeout=0.1)
+            if stop.is_set():
+                return
+            start = time.perf_counter()
+            result = transform(chunk)
+            metrics.add_busy("transform", time.perf_counter() - start)
+            if not put(write_queue, (seq, result), "write_queue"):
+                return
+
+    def writer():
+        finished = 0
+        next_seq = 0
+        pending = {}
+        with open(output_path, "w", encoding="utf-8", newline="") as f:
+            while finished < workers:
+                item = get(write_queue)
+                if item is None:
+                    return
+                if item is _DONE:
+                    finished += 1
+                    continue
+                seq, chunk = item
+                pending[seq] = chunk
+                metrics.depths["reorder_buffer"].append(len(pending))
+                # Chunks can finish out of order; write them in input order
+                while next_seq in pending:
+                    chunk = pending.pop(next_seq)
+                    start = time.perf_counter()
+                    chunk.to_csv(f, header=next_seq == 0, index=False)
+                    metrics.add_busy("write", time.perf_counter() - start)
+                    metrics.chunks += 1
+                    metrics.rows += len(chunk)
+                    next_seq += 1
+                    with progress:
+                        written[0] = next_seq
+                        progress.notify_all()
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=guarded(reader), name="etl-reader")]
+    threads += [threading.Thread(target=guarded(transformer), name=f"etl-transform-{i}") for i in range(workers)]
+    threads.append(threading.Thread(target=guarded(writer), name="etl-writer"))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    metrics.seconds = time.perf_counter() - start
+
+    if errors:
+        raise errors[0]
+
+    print(f"Streamed {metrics.rows} rows in {metrics.chunks} chunks to {output_path} "
+          f"({metrics.as_dict()['rows_per_second']} rows/s)")
+    return metrics
@@ -1,31 +1,75 @@
 """
 End-to-end data transformation to prepare the dataset for analysis.
+
+When an output column set is given, lineage.py decides which stages and
+columns are needed; only those are imputed and computed, and the explicit
+column set replaces the correlation-based reduction.
+
+impute=False skips the dependency-aware imputation, whose cost grows with
+rows x missing values; quicklook.py uses it on large samples.
+
+A FittedState (fitted_state.py) replaces the per-dataset fit of the one-hot
+levels, age bin edges and job_optimism mapping with a shared one.
 """
 
 import pandas as pd
-from sklearn.feature_selection import VarianceThreshold
-from sklearn.preprocessing import KBinsDiscretizer
-from sklearn.preprocessing import OneHotEncoder
-from dependency_map import dependency_map
-from missingValues import advanced_imputation
-from binarization import apply_binarization
-from aggregation import add_aggregated
-from features import create_features
-from discretization import apply_discretization
-from column_names import titlecase_columns
-from feature_reduction_enhanced import reduce_dimensions_enhanced
-from protected_cols import protected_cols
-
-def transform_data(df: pd.DataFrame) -> pd.DataFrame:
+from .dependency_map import dependency_map
+from .missingValues import advanced_imputation
+from .binarization import BINARY_RULES, apply_binarization
+from .aggregation import add_aggregated
+from .features import create_features
+from .discretization import apply_discretization
+from .column_names import titlecase_columns
+from .feature_reduction_enhanced import reduce_dimensions_enhanced
+from .protected_cols import protected_cols
+from .lineage import output_columns, required_columns, select_outputs
+from .fitted_state import FittedState
+
+def transform_pruned(df: pd.DataFrame, columns: list, state: FittedState = None, impute: bool = True) -> pd.DataFrame:
+    state = state or FittedState()
+    outputs = output_columns(columns, protected_cols)
+    needed = set(required_columns(columns, protected_cols))
+    df = df[[col for col in df.columns if col in needed]].copy()
+
+    #Missing Value Imputation
+    if impute:
+        df = advanced_imputation(df, dependency_map)
+
+    # Binarization
+    rules = [rule for rule in BINARY_RULES if rule[0] in outputs]
+    df = apply_binarization(df, rules=rules, categories=state.categories)
+
+    # Aggregation
+    if "job_optimism" in outputs:
+        df = add_aggregated(df, optimism_map=state.optimism_map)
+
+    #Krijimi i vetive
+    df = create_features(df, features=outputs)
+
+    #Discretization
+    if "age" in outputs:
+        df = apply_discretization(df, column="age", n_bins=5, strategy="uniform", bin_edges=state.age_edges)
+
+    df = df[select_outputs(df.columns, outputs)]
+    print(f"Pruned transform: {len(df.columns)} output columns")
+
+    #Column names to uppercase
+    return titlecase_columns(df)
+
+def transform_data(df: pd.DataFrame, columns: list = None, state: FittedState = None, impute: bool = True) -> pd.DataFrame:
+    if columns:
+        return transform_pruned(df, columns, state, impute)
+    state = state or FittedState()
     
     #Missing Value Imputation
-    df = advanced_imputation(df, dependency_map)
+    if impute:
+        df = advanced_imputation(df, dependency_map)
     
     # Binarization
-    df = apply_binarization(df)
+    df = apply_binarization(df, categories=state.categories)
 
     # Aggregation
-    df = add_aggregated(df)
+    df = add_aggregated(df, optimism_map=state.optimism_map)
 
     #Krijimi i vetive
     df = create_features(df)
@@ -34,7 +78,7 @@ def transform_data(df: pd.DataFrame) -> pd.DataFrame:
     # df = select_features(df)
 
     #Discretization
-    df = apply_discretization(df, column="age", n_bins=5, strategy="uniform")
+    df = apply_discretization(df, column="age", n_bins=5, strategy="uniform", bin_edges=state.age_edges)
 
     #Dimension Reduction
     df = reduce_dimensions_enhanced(df, protected_cols=protected_cols, corr_threshold=0.98)
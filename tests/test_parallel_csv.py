@@ -0,0 +1,69 @@
+"""Parallel CSV reading and writing must match single-process pandas."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl.parallel_csv import line_offsets, read_csv_parallel, read_csv_rows, write_csv_parallel
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = 5_000
+    return pd.DataFrame({
+        "id": np.arange(n),
+        "score": rng.normal(size=n).round(6),
+        "hours": np.where(rng.random(n) < 0.1, np.nan, rng.uniform(0, 12, n)),
+        "label": rng.choice(["a", "b, with comma", 'say "hi"', ""], size=n),
+        "flag": rng.random(n) < 0.5,
+    })
+
+def test_writer_is_byte_identical_to_to_csv(frame, tmp_path):
+    expected, actual = tmp_path / "expected.csv", tmp_path / "actual.csv"
+    frame.to_csv(expected, index=False)
+    write_csv_parallel(frame, actual, workers=3, block_rows=700, index=False)
+    assert actual.read_bytes() == expected.read_bytes()
+
+def test_writer_keeps_options(frame, tmp_path):
+    expected, actual = tmp_path / "expected.csv", tmp_path / "actual.csv"
+    options = {"index": True, "sep": ";", "float_format": "%.3f", "na_rep": "NA"}
+    frame.to_csv(expected, **options)
+    write_csv_parallel(frame, actual, workers=2, block_rows=1_000, **options)
+    assert actual.read_bytes() == expected.read_bytes()
+
+def test_reader_matches_read_csv(frame, tmp_path):
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+    result = read_csv_parallel(str(path), workers=3, chunk_bytes=10_000)
+    pd.testing.assert_frame_equal(result, pd.read_csv(path))
+
+def test_reader_reconciles_dtypes_that_differ_between_ranges(tmp_path):
+    path = tmp_path / "mixed.csv"
+    pd.DataFrame({
+        "code": ["7"] * 2_000 + ["A1"] * 2_000,
+        "flag": ["True"] * 2_000 + ["False", ""] * 1_000,
+        "count": list(range(3_999)) + [None],
+    }).to_csv(path, index=False)
+
+    expected = pd.read_csv(path)
+    result = read_csv_parallel(str(path), workers=2, chunk_bytes=1_000)
+    pd.testing.assert_frame_equal(result, expected)
+    assert result["code"].map(type).eq(str).all()
+
+def test_reader_falls_back_for_positional_options(frame, tmp_path):
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+    result = read_csv_parallel(str(path), workers=3, chunk_bytes=10_000, nrows=123)
+    pd.testing.assert_frame_equal(result, pd.read_csv(path, nrows=123))
+
+def test_row_reader_matches_selected_rows(frame, tmp_path):
+    path = tmp_path / "data.csv"
+    # No trailing newline: the last row must still be readable
+    path.write_bytes(frame.to_csv(index=False).encode().rstrip(b"\n"))
+    header, offsets = line_offsets(str(path), block_bytes=4_096)
+    assert len(offsets) - 1 == len(frame)
+
+    rows = np.random.default_rng(1).choice(len(frame), 300, replace=False).tolist() + [len(frame) - 1]
+    result = read_csv_rows(str(path), header, offsets, rows)
+    expected = pd.read_csv(path).iloc[np.sort(rows)].reset_index(drop=True)
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), expected)
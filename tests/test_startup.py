@@ -0,0 +1,10 @@
+"""Cold-start budget of the pvdh-etl command line interface."""
+
+from etl.cli import STARTUP_BUDGET_SECONDS, heavy_startup_modules, measure_startup
+
+def test_cold_start_within_budget():
+    elapsed = measure_startup()
+    assert elapsed < STARTUP_BUDGET_SECONDS, f"cold start took {elapsed:.3f}s (budget {STARTUP_BUDGET_SECONDS}s)"
+
+def test_cli_import_loads_no_heavy_modules():
+    assert heavy_startup_modules() == []